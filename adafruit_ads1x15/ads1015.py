@@ -14,7 +14,7 @@ CircuitPython driver for ADS1015 ADCs.
 import struct
 
 try:
-    from typing import Dict, List
+    from typing import Dict, Tuple
 
     from typing_extensions import Literal
 except ImportError:
@@ -32,22 +32,23 @@ _ADS1015_CONFIG_DR = {
     2400: 0x00A0,
     3300: 0x00C0,
 }
+_ADS1015_RATES = (128, 250, 490, 920, 1600, 2400, 3300)
 
 
 class ADS1015(ADS1x15):
     """Class for the ADS1015 12 bit ADC."""
 
+    __slots__ = ()
+
     @property
     def bits(self) -> Literal[12]:
         """The ADC bit resolution."""
         return 12
 
     @property
-    def rates(self) -> List[int]:
+    def rates(self) -> Tuple[int, ...]:
         """Possible data rate settings."""
-        r = list(_ADS1015_CONFIG_DR.keys())
-        r.sort()
-        return r
+        return _ADS1015_RATES
 
     @property
     def rate_config(self) -> Dict[int, int]:
@@ -14,7 +14,7 @@ CircuitPython driver for 1115 ADCs.
 import struct
 
 try:
-    from typing import Dict, List
+    from typing import Dict, Tuple
 
     from typing_extensions import Literal
 except ImportError:
@@ -33,22 +33,23 @@ _ADS1115_CONFIG_DR = {
     475: 0x00C0,
     860: 0x00E0,
 }
+_ADS1115_RATES = (8, 16, 32, 64, 128, 250, 475, 860)
 
 
 class ADS1115(ADS1x15):
     """Class for the ADS1115 16 bit ADC."""
 
+    __slots__ = ()
+
     @property
     def bits(self) -> Literal[16]:
         """The ADC bit resolution."""
         return 16
 
     @property
-    def rates(self) -> List[int]:
+    def rates(self) -> Tuple[int, ...]:
         """Possible data rate settings."""
-        r = list(_ADS1115_CONFIG_DR.keys())
-        r.sort()
-        return r
+        return _ADS1115_RATES
 
     @property
     def rate_config(self) -> Dict[int, int]:
@@ -15,17 +15,27 @@ __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_ADS1x15.git"
 
 import time
+from array import array
 
 from adafruit_bus_device.i2c_device import I2CDevice
 from micropython import const
 
+from .transport import I2CDeviceTransport, Transaction
+
 try:
-    from typing import Dict, List, Optional
+    from typing import Dict, List, Optional, Sequence, Tuple
 
     from busio import I2C
+
+    from .transport import Transport
 except ImportError:
     pass
 
+try:
+    from threading import Event, Lock, RLock
+except ImportError:
+    RLock = None
+
 _ADS1X15_DEFAULT_ADDRESS = const(0x48)
 _ADS1X15_POINTER_CONVERSION = const(0x00)
 _ADS1X15_POINTER_CONFIG = const(0x01)
@@ -34,20 +44,22 @@ _ADS1X15_POINTER_HI_THRES = const(0x03)
 
 _ADS1X15_CONFIG_OS_SINGLE = const(0x8000)
 _ADS1X15_CONFIG_MUX_OFFSET = const(12)
-_ADS1X15_CONFIG_COMP_QUEUE = {
-    0: 0x0003,
-    1: 0x0000,
-    2: 0x0001,
-    4: 0x0002,
-}
-_ADS1X15_CONFIG_GAIN = {
-    2 / 3: 0x0000,
-    1: 0x0200,
-    2: 0x0400,
-    4: 0x0600,
-    8: 0x0800,
-    16: 0x0A00,
-}
+_ADS1X15_CONFIG_MUX_MASK = const(0x7000)
+_ADS1X15_CONFIG_GAIN_OFFSET = const(9)
+_ADS1X15_CONFIG_GAIN_MASK = const(0x0E00)
+_ADS1X15_CONFIG_COMP_QUEUE_MASK = const(0x0003)
+# Settings indexed by their code in the config register
+_ADS1X15_GAINS = (2 / 3, 1, 2, 4, 8, 16)
+_ADS1X15_CONFIG_COMP_QUEUE = (1, 2, 4, 0)
+_ADS1X15_COMP_QUEUE_LENGTHS = (0, 1, 2, 4)
+# In CONTINUOUS mode a conversion already running when the MUX changes
+# finishes with the old input, so the first result of the new input can take
+# up to two conversion periods. The margin covers timing jitter.
+_ADS1X15_SETTLE_PERIODS = 2
+_ADS1X15_SETTLE_MARGIN = 1.05
+# Without a measured period, assume the internal oscillator runs at the slow
+# end of its +-10% tolerance so conversion times are never underestimated
+_ADS1X15_OSCILLATOR_MARGIN = 1.1
 
 
 class Pin:
@@ -107,6 +119,32 @@ class Comp_Latch:
     """ALERT_RDY pin remains asserted until data is read by controller"""
 
 
+class _NoLock:
+    """Stand-in for a lock when thread safety is not requested."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+
+_NO_LOCK = _NoLock()
+
+
+class _Flight:
+    """A conversion in progress that concurrent readers of the same pin wait on."""
+
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self):
+        self.done = Event()
+        self.result = None
+        self.error = None
+
+
 class ADS1x15:
     """Base functionality for ADS1x15 analog to digital converters.
 
@@ -132,8 +170,38 @@ class ADS1x15:
                           readings exceed threshold or latch on assertion until data is read.
                           Defaults to 'Comp_Latch.NONLATCHING'
     :param int address: The I2C address of the device.
+    :param Transport transport: Register transport to use instead of an
+                          `I2CDevice` on ``i2c``, for example a
+                          `transport.LinuxI2CTransport`. ``i2c`` and ``address``
+                          are ignored when this is given.
+    :param bool thread_safe: Serialize bus access with a per-device lock so the device
+                          can be shared between threads. Concurrent reads of the same
+                          pin share a single conversion. Defaults to False.
     """
 
+    __slots__ = (
+        "_comparator_high_threshold",
+        "_comparator_latch",
+        "_comparator_low_threshold",
+        "_comparator_mode",
+        "_comparator_polarity",
+        "_comparator_queue_code",
+        "_config_generation",
+        "_data_rate",
+        "_flights",
+        "_flights_lock",
+        "_gain_code",
+        "_last_config",
+        "_last_pin_read",
+        "_lock",
+        "_measured_periods",
+        "_mode",
+        "_poll_transaction",
+        "i2c_device",
+        "initialized",
+        "transport",
+    )
+
     def __init__(
         self,
         i2c: "I2C",
@@ -147,11 +215,33 @@ class ADS1x15:
         comparator_polarity: int = Comp_Polarity.ACTIVE_LOW,
         comparator_latch: int = Comp_Latch.NONLATCHING,
         address: int = _ADS1X15_DEFAULT_ADDRESS,
+        thread_safe: bool = False,
+        transport: Optional[Transport] = None,
     ):
+        if thread_safe:
+            if RLock is None:
+                raise RuntimeError("thread_safe requires the threading module")
+            self._lock = RLock()
+            self._flights_lock = Lock()
+            self._flights = {}
+        else:
+            self._lock = _NO_LOCK
+            self._flights = None
         self._last_pin_read = None
-        self.buf = bytearray(3)
+        self._last_config = None
+        self._config_generation = 0  # Incremented whenever settings other than MUX change
+        self._measured_periods = None  # Conversion periods by data rate, once measured
         self.initialized = False  # Prevents writing to ADC until all values are initialized
-        self.i2c_device = I2CDevice(i2c, address)
+        if transport is None:
+            transport = I2CDeviceTransport(I2CDevice(i2c, address))
+        self.transport = transport
+        self.i2c_device = getattr(transport, "i2c_device", None)
+        self._poll_transaction = None
+        if transport.combined:
+            # Reads the OS bit and the conversion register in one combined transfer
+            self._poll_transaction = Transaction()
+            self._poll_transaction.read_register(_ADS1X15_POINTER_CONFIG)
+            self._poll_transaction.read_register(_ADS1X15_POINTER_CONVERSION)
         self.gain = gain
         self.data_rate = self._data_rate_default() if data_rate is None else data_rate
         self.mode = mode
@@ -184,7 +274,15 @@ class ADS1x15:
             self._write_config()
 
     @property
-    def rates(self) -> List[int]:
+    def measured_data_rate(self) -> Optional[float]:
+        """The conversion rate measured by `measure_data_rate` for the current
+        `data_rate` setting in samples per second, or None if it has not been
+        measured yet."""
+        period = self.conversion_period()
+        return None if period is None else 1 / period
+
+    @property
+    def rates(self) -> Tuple[int, ...]:
         """Possible data rate settings."""
         raise NotImplementedError("Subclass must implement rates property.")
 
@@ -196,44 +294,38 @@ class ADS1x15:
     @property
     def gain(self) -> float:
         """The ADC gain."""
-        return self._gain
+        return _ADS1X15_GAINS[self._gain_code]
 
     @gain.setter
     def gain(self, gain: float) -> None:
-        possible_gains = self.gains
-        if gain not in possible_gains:
-            raise ValueError(f"Gain must be one of: {possible_gains}")
-        self._gain = gain
+        if gain not in _ADS1X15_GAINS:
+            raise ValueError(f"Gain must be one of: {_ADS1X15_GAINS}")
+        self._gain_code = _ADS1X15_GAINS.index(gain)
         if self.initialized:
             self._write_config()
 
     @property
-    def gains(self) -> List[float]:
+    def gains(self) -> Tuple[float, ...]:
         """Possible gain settings."""
-        g = list(_ADS1X15_CONFIG_GAIN.keys())
-        g.sort()
-        return g
+        return _ADS1X15_GAINS
 
     @property
     def comparator_queue_length(self) -> int:
         """The ADC comparator queue length."""
-        return self._comparator_queue_length
+        return _ADS1X15_CONFIG_COMP_QUEUE[self._comparator_queue_code]
 
     @comparator_queue_length.setter
     def comparator_queue_length(self, comparator_queue_length: int) -> None:
-        possible_comp_queue_lengths = self.comparator_queue_lengths
-        if comparator_queue_length not in possible_comp_queue_lengths:
-            raise ValueError(f"Comparator Queue must be one of: {possible_comp_queue_lengths}")
-        self._comparator_queue_length = comparator_queue_length
+        if comparator_queue_length not in _ADS1X15_COMP_QUEUE_LENGTHS:
+            raise ValueError(f"Comparator Queue must be one of: {_ADS1X15_COMP_QUEUE_LENGTHS}")
+        self._comparator_queue_code = _ADS1X15_CONFIG_COMP_QUEUE.index(comparator_queue_length)
         if self.initialized:
             self._write_config()
 
     @property
-    def comparator_queue_lengths(self) -> List[int]:
+    def comparator_queue_lengths(self) -> Tuple[int, ...]:
         """Possible comparator queue length settings."""
-        g = list(_ADS1X15_CONFIG_COMP_QUEUE.keys())
-        g.sort()
-        return g
+        return _ADS1X15_COMP_QUEUE_LENGTHS
 
     @property
     def comparator_low_threshold(self) -> int:
@@ -327,7 +419,32 @@ class ADS1x15:
         :param int pin: individual or differential pin.
         :param bool is_differential: single-ended or differential read.
         """
-        return self._read(pin)
+        if self._flights is None:
+            return self._read(pin)
+
+        # Join a conversion already in flight for this pin, or start one
+        with self._flights_lock:
+            flight = self._flights.get(pin)
+            leader = flight is None
+            if leader:
+                flight = self._flights[pin] = _Flight()
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            with self._lock:
+                flight.result = self._read(pin)
+        except Exception as error:
+            flight.error = error
+            raise
+        finally:
+            with self._flights_lock:
+                del self._flights[pin]
+            flight.done.set()
+        return flight.result
 
     def _data_rate_default(self) -> int:
         """Retrieve the default data rate for this ADC (in samples per second).
@@ -358,16 +475,138 @@ class ADS1x15:
         # Wait for conversion to complete
         # ADS1x1x devices settle within a single conversion cycle
         if self.mode == Mode.SINGLE:
+            if self._poll_transaction is not None:
+                # Fetch the result along with every status poll, so no further
+                # transfer is needed once the conversion is complete
+                with self._lock:
+                    while True:
+                        status, result = self.transport.submit(self._poll_transaction)
+                        if status & 0x8000:
+                            return self._conversion_value(result)
             # Continuously poll conversion complete status bit
             while not self._conversion_complete():
                 pass
         else:
             # Can't poll registers in CONTINUOUS mode
-            # Wait expected time for two conversions to complete
-            time.sleep(2 / self.data_rate)
+            time.sleep(self.settle_time())
 
         return self._conversion_value(self.get_last_result(False))
 
+    def read_pipelined(self, pins: Sequence[int], count: int, out: Optional[array] = None) -> array:
+        """Perform ``count`` scans of ``pins`` in SINGLE mode, starting each
+        conversion in the same transaction that reads the previous result.
+        The device converts the next pin while the host polls and processes,
+        approaching the throughput of CONTINUOUS mode, while every reading
+        still belongs to exactly one known pin.
+
+        :param pins: Individual or differential pin settings to read in turn.
+        :param int count: The number of scans of ``pins``.
+        :param array out: Optional ``array("h")`` to store the readings in,
+                          reused between calls to avoid allocations.
+        :return: The readings with the pins of each scan interleaved.
+        """
+        if self.mode != Mode.SINGLE:
+            raise RuntimeError("Pipelined reads require SINGLE mode")
+        width = len(pins)
+        total = count * width
+        if out is None:
+            out = array("h", (0 for _ in range(total)))
+        elif len(out) < total:
+            raise ValueError("Output buffer is too small")
+        if not total:
+            return out
+
+        configs = tuple(self._config_value(pin) for pin in pins)
+        fused = Transaction()
+        fused.read_register(_ADS1X15_POINTER_CONVERSION)
+        trigger = fused.write_register(_ADS1X15_POINTER_CONFIG, configs[0])
+        with self._lock:
+            self._write_register(_ADS1X15_POINTER_CONFIG, configs[0])
+            for index in range(1, total):
+                while not self._conversion_complete():
+                    pass
+                # The result is read before the write starts the next conversion
+                fused.set_value(trigger, configs[index % width])
+                out[index - 1] = self._conversion_value(self.transport.submit(fused)[0])
+            while not self._conversion_complete():
+                pass
+            out[total - 1] = self._conversion_value(self.get_last_result(False))
+            self._last_pin_read = pins[-1]
+            self._note_config(configs[-1])
+        return out
+
+    def conversion_period(self, data_rate: Optional[int] = None) -> Optional[float]:
+        """The conversion period in seconds measured by `measure_data_rate`
+        at a data rate, or None if it has not been measured yet.
+
+        :param int data_rate: The data rate. Defaults to the current `data_rate`.
+        """
+        if self._measured_periods is None:
+            return None
+        return self._measured_periods.get(self._data_rate if data_rate is None else data_rate)
+
+    def settle_time(self, data_rate: Optional[int] = None) -> float:
+        """Time in seconds to wait after a MUX change in CONTINUOUS mode
+        before the conversion register holds a result of the new input.
+
+        :param int data_rate: The data rate. Defaults to the current `data_rate`.
+        """
+        if data_rate is None:
+            data_rate = self._data_rate
+        period = self.conversion_period(data_rate)
+        if period is None:
+            return _ADS1X15_SETTLE_PERIODS * _ADS1X15_OSCILLATOR_MARGIN / data_rate
+        return _ADS1X15_SETTLE_PERIODS * period * _ADS1X15_SETTLE_MARGIN
+
+    def measure_data_rate(self, conversions: int = 16, timeout: Optional[float] = None) -> float:
+        """Measure the real conversion rate of the device at the current
+        `data_rate` setting. The conversion register is polled in CONTINUOUS
+        mode and the time between changes of its value is used to estimate the
+        conversion period, so the selected input must not be perfectly static.
+        The result is stored, exposed by `measured_data_rate` and used to
+        shorten the settle time after channel changes in CONTINUOUS mode.
+
+        :param int conversions: The number of value changes to time.
+        :param float timeout: Maximum time to spend measuring in seconds.
+                              Defaults to four nominal periods per conversion.
+        :return: The measured conversion rate in samples per second.
+        """
+        nominal = 1 / self._data_rate
+        if timeout is None:
+            timeout = 4 * conversions * nominal
+        with self._lock:
+            mode = self._mode
+            if mode != Mode.CONTINUOUS:
+                self.mode = Mode.CONTINUOUS
+            try:
+                last = self.get_last_result(False)
+                changes = []
+                deadline = time.monotonic() + timeout
+                while len(changes) <= conversions:
+                    value = self.get_last_result(True)
+                    now = time.monotonic()
+                    if value != last:
+                        changes.append(now)
+                        last = value
+                    elif now > deadline:
+                        break
+            finally:
+                if mode != Mode.CONTINUOUS:
+                    self.mode = mode
+
+        if len(changes) < 2:
+            raise RuntimeError("Conversion result did not change, unable to measure data rate")
+        # Identical consecutive results hide conversions, so count the nominal
+        # periods between each observed change
+        periods = 0
+        for i in range(1, len(changes)):
+            periods += max(1, round((changes[i] - changes[i - 1]) / nominal))
+        period = (changes[-1] - changes[0]) / periods
+        if self._measured_periods is None:
+            self._measured_periods = {}
+        self._measured_periods[self._data_rate] = period
+        return 1 / period
+
     def _conversion_complete(self) -> int:
         """Return status of ADC conversion."""
         # OS is bit 15
@@ -385,63 +624,84 @@ class ADS1x15:
 
     def _write_register(self, reg: int, value: int):
         """Write 16 bit value to register."""
-        self.buf[0] = reg
-        self.buf[1] = (value >> 8) & 0xFF
-        self.buf[2] = value & 0xFF
-        with self.i2c_device as i2c:
-            i2c.write(self.buf)
+        with self._lock:
+            self.transport.write_register(reg, value)
 
     def _read_register(self, reg: int, fast: bool = False) -> int:
         """Read 16 bit register value. If fast is True, the pointer register
         is not updated.
         """
-        with self.i2c_device as i2c:
-            if fast:
-                i2c.readinto(self.buf, end=2)
-            else:
-                i2c.write_then_readinto(bytearray([reg]), self.buf, in_end=2)
-        return self.buf[0] << 8 | self.buf[1]
+        with self._lock:
+            return self.transport.read_register(reg, fast)
 
     def _write_config(self, pin_config: Optional[int] = None) -> None:
         """Write to configuration register of ADC
 
         :param int pin_config: setting for MUX value in config register
         """
-        if pin_config is None:
-            pin_config = (
-                self._read_register(_ADS1X15_POINTER_CONFIG) & 0x7000
-            ) >> _ADS1X15_CONFIG_MUX_OFFSET
+        with self._lock:
+            if pin_config is None:
+                pin_config = (
+                    self._read_register(_ADS1X15_POINTER_CONFIG) & 0x7000
+                ) >> _ADS1X15_CONFIG_MUX_OFFSET
 
-        if self.mode == Mode.SINGLE:
+            config = self._config_value(pin_config)
+            self._write_register(_ADS1X15_POINTER_CONFIG, config)
+            self._note_config(config)
+
+    def _config_value(
+        self,
+        pin_config: int,
+        gain: Optional[float] = None,
+        data_rate: Optional[int] = None,
+        mode: Optional[int] = None,
+    ) -> int:
+        """Configuration register value selecting a MUX setting, starting a
+        conversion in SINGLE mode. Gain, data rate and mode default to the
+        current settings."""
+        gain_code = self._gain_code if gain is None else _ADS1X15_GAINS.index(gain)
+        if data_rate is None:
+            data_rate = self.data_rate
+        if mode is None:
+            mode = self.mode
+        if mode == Mode.SINGLE:
             config = _ADS1X15_CONFIG_OS_SINGLE
         else:
             config = 0
 
         config |= (pin_config & 0x07) << _ADS1X15_CONFIG_MUX_OFFSET
-        config |= _ADS1X15_CONFIG_GAIN[self.gain]
-        config |= self.mode
-        config |= self.rate_config[self.data_rate]
+        config |= gain_code << _ADS1X15_CONFIG_GAIN_OFFSET
+        config |= mode
+        config |= self.rate_config[data_rate]
         config |= self.comparator_mode
         config |= self.comparator_polarity
         config |= self.comparator_latch
-        config |= _ADS1X15_CONFIG_COMP_QUEUE[self.comparator_queue_length]
-        self._write_register(_ADS1X15_POINTER_CONFIG, config)
+        config |= self._comparator_queue_code
+        return config
+
+    def _note_config(self, config: int) -> None:
+        """Record a written configuration, counting changes of it."""
+        # Starting a single conversion is not a configuration change, and
+        # neither is selecting another input, as each channel has its own
+        config &= ~(_ADS1X15_CONFIG_OS_SINGLE | _ADS1X15_CONFIG_MUX_MASK)
+        if config != self._last_config:
+            self._last_config = config
+            self._config_generation += 1
 
     def _read_config(self) -> None:
         """Reads Config Register and sets all properties accordingly"""
         config_value = self._read_register(_ADS1X15_POINTER_CONFIG)
 
-        self.gain = next(
-            key for key, value in _ADS1X15_CONFIG_GAIN.items() if value == (config_value & 0x0E00)
-        )
+        # Gain codes above 5 are all the same as 5
+        self.gain = _ADS1X15_GAINS[
+            min((config_value & _ADS1X15_CONFIG_GAIN_MASK) >> _ADS1X15_CONFIG_GAIN_OFFSET, 5)
+        ]
         self.data_rate = next(
             key for key, value in self.rate_config.items() if value == (config_value & 0x00E0)
         )
-        self.comparator_queue_length = next(
-            key
-            for key, value in _ADS1X15_CONFIG_COMP_QUEUE.items()
-            if value == (config_value & 0x0003)
-        )
+        self.comparator_queue_length = _ADS1X15_CONFIG_COMP_QUEUE[
+            config_value & _ADS1X15_CONFIG_COMP_QUEUE_MASK
+        ]
         self.mode = Mode.SINGLE if config_value & 0x0100 else Mode.CONTINUOUS
         self.comparator_mode = Comp_Mode.WINDOW if config_value & 0x0010 else Comp_Mode.TRADITIONAL
         self.comparator_polarity = (
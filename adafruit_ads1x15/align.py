@@ -0,0 +1,112 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`align`
+====================================================
+
+Alignment of timestamped readings from several ADCs onto a common timebase.
+
+Requires NumPy, or ulab on CircuitPython boards.
+
+* Author(s): Adafruit Industries
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    try:
+        from ulab import numpy as np
+    except ImportError:
+        np = None
+
+try:
+    from typing import Optional, Sequence, Tuple
+except ImportError:
+    pass
+
+
+class TimelineMerger:
+    """Resamples streams of timestamped readings, for example one per
+    `ADS1x15` device each running on its own oscillator, onto one shared
+    sample grid using linear interpolation.
+
+    Add blocks of readings to each stream as they arrive with `add`, and call
+    `merge` to get every grid point that all streams have reached so far.
+    Only the readings still needed for interpolation are kept between calls.
+
+    :param float rate: Rate of the common timebase in samples per second.
+    :param widths: The number of channels in each stream. Readings of a stream
+                   with several channels are interleaved, as returned by
+                   `sampler.PeriodicSampler.sample`.
+    """
+
+    def __init__(self, rate: float, widths: Sequence[int]):
+        if np is None:
+            raise RuntimeError("TimelineMerger requires numpy or ulab")
+        self.rate = rate
+        self.widths = tuple(widths)
+        self.channels = sum(self.widths)
+        """Total number of channels in the merged output."""
+        self._times = [np.zeros(0) for _ in self.widths]
+        self._values = [np.zeros((0, width)) for width in self.widths]
+        self._epoch = None
+        self._start = None
+        self._next = 0
+
+    def add(self, stream: int, timestamps: Sequence[float], values: Sequence[float]) -> None:
+        """Add a block of readings to a stream.
+
+        :param int stream: Index of the stream in ``widths``.
+        :param timestamps: Increasing time of each reading, for example from
+                           `time.monotonic`.
+        :param values: The readings, ``widths[stream]`` per timestamp.
+        """
+        count = len(timestamps)
+        if not count:
+            return
+        if len(values) != count * self.widths[stream]:
+            raise ValueError("Stream must have widths[stream] values per timestamp")
+        if self._epoch is None:
+            # Keep times small so single precision arrays can hold them
+            self._epoch = timestamps[0]
+        times = np.array(timestamps) - self._epoch
+        block = np.array(values).reshape((count, self.widths[stream]))
+        self._times[stream] = np.concatenate((self._times[stream], times))
+        self._values[stream] = np.concatenate((self._values[stream], block))
+
+    def merge(self) -> Tuple[Optional[object], Optional[object]]:
+        """Interpolate every stream at the grid points all of them cover.
+
+        :return: A tuple of the grid timestamps, on the same clock as the added
+                 ones, and an array with one row per timestamp and one column per
+                 channel in stream order. Both are None when no new grid point
+                 is covered yet.
+        """
+        if any(len(times) == 0 for times in self._times):
+            return None, None
+        if self._start is None:
+            # The grid starts once every stream has begun
+            self._start = max(float(times[0]) for times in self._times)
+        end = min(float(times[-1]) for times in self._times)
+        count = int((end - self._start) * self.rate) + 1 - self._next
+        if count <= 0:
+            return None, None
+
+        # Offsets from the grid start avoid accumulating rounding errors
+        grid = self._start + (np.arange(count) + self._next) / self.rate
+        self._next += count
+        merged = np.zeros((count, self.channels))
+        column = 0
+        for stream, width in enumerate(self.widths):
+            times = self._times[stream]
+            values = self._values[stream]
+            for channel in range(width):
+                merged[:, column] = np.interp(grid, times, values[:, channel])
+                column += 1
+            # Keep the last reading at or before the newest grid point onwards
+            keep = max(int(np.sum(times <= grid[-1])) - 1, 0)
+            self._times[stream] = times[keep:]
+            self._values[stream] = values[keep:]
+        return grid + self._epoch, merged
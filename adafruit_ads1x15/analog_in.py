@@ -11,15 +11,94 @@ differential ADC readings.
 * Author(s): Carter Nelson, adapted from MCP3xxx original by Brent Rubell
 """
 
+import gc
+import time
+from array import array
+
+from micropython import const
+
 try:
-    from typing import Optional
+    from typing import Dict, List, Optional, Sequence, Tuple
 
     from .ads1x15 import ADS1x15
 except ImportError:
     pass
 
 _ADS1X15_DIFF_CHANNELS = {(0, 1): 0, (0, 3): 1, (1, 3): 2, (2, 3): 3}
-_ADS1X15_PGA_RANGE = {2 / 3: 6.144, 1: 4.096, 2: 2.048, 4: 1.024, 8: 0.512, 16: 0.256}
+# Full scale voltage indexed by gain code, see ADS1x15.gains
+_ADS1X15_PGA_RANGE = (6.144, 4.096, 2.048, 1.024, 0.512, 0.256)
+
+# Voltage lookup tables are only built for devices with at most this many bits
+# (4096 entries for the 12-bit ADS1015), keyed by (bits, gain code, calibration).
+# Channels keep a reference to the table they use, so the shared cache only
+# needs to hold the most recently built ones for other channels to reuse.
+_ADS1X15_TABLE_MAX_BITS = const(12)
+_ADS1X15_TABLE_MAX_COUNT = const(2)
+# Tables hold doubles where floats are doubles, so looked up voltages are
+# exactly the computed ones, and singles on boards with single precision floats
+_ADS1X15_TABLE_TYPECODE = "d" if 1.0 + 2.0**-30 != 1.0 else "f"
+_voltage_tables = {}  # type: Dict[Tuple[int, int, Optional[Tuple[int, float]]], array]
+_voltage_table_order = []  # type: List[Tuple[int, int, Optional[Tuple[int, float]]]]
+# Incremented by clear_voltage_tables so channels drop their tables too
+_voltage_table_epoch = [0]
+
+
+def _build_voltage_table(
+    bits: int, gain_code: int, calibration: Optional[Tuple[int, float]]
+) -> array:
+    """Build a table mapping every native ADC code (two's complement, used
+    as an unsigned index) to its voltage, computed like `AnalogIn.convert_to_voltage`."""
+    size = 1 << bits
+    half = size >> 1
+    lsb = _ADS1X15_PGA_RANGE[gain_code] / half
+    codes = (i - (size if i >= half else 0) for i in range(size))
+    if calibration is None:
+        return array(_ADS1X15_TABLE_TYPECODE, (code * lsb for code in codes))
+    offset, scale = calibration
+    return array(_ADS1X15_TABLE_TYPECODE, ((code - offset) * lsb * scale for code in codes))
+
+
+def _voltage_table(
+    bits: int, gain_code: int, calibration: Optional[Tuple[int, float]]
+) -> Optional[array]:
+    """Return the cached voltage table for this configuration, building it on
+    first use. Returns None if the device resolution is too high for a table
+    or there is not enough memory to build one."""
+    if bits > _ADS1X15_TABLE_MAX_BITS:
+        return None
+    key = (bits, gain_code, calibration)
+    table = _voltage_tables.get(key)
+    if table is not None:
+        if _voltage_table_order[-1] != key:
+            _voltage_table_order.remove(key)
+            _voltage_table_order.append(key)
+        return table
+
+    if len(_voltage_tables) >= _ADS1X15_TABLE_MAX_COUNT:
+        del _voltage_tables[_voltage_table_order.pop(0)]
+    try:
+        table = _build_voltage_table(bits, gain_code, calibration)
+    except MemoryError:
+        # Evict every cached table and try once more before falling back
+        # to computing voltages on every call
+        clear_voltage_tables()
+        try:
+            table = _build_voltage_table(bits, gain_code, calibration)
+        except MemoryError:
+            return None
+    _voltage_tables[key] = table
+    _voltage_table_order.append(key)
+    return table
+
+
+def clear_voltage_tables() -> None:
+    """Release all cached raw-to-voltage lookup tables. Channels release the
+    table they use at their next conversion. Tables are rebuilt lazily the
+    next time a conversion needs them."""
+    _voltage_tables.clear()
+    _voltage_table_order.clear()
+    _voltage_table_epoch[0] += 1
+    gc.collect()
 
 
 class AnalogIn:
@@ -28,12 +107,40 @@ class AnalogIn:
     :param ADS1x15 ads: The ads object.
     :param int positive_pin: Required pin for single-ended.
     :param int negative_pin: Optional pin for differential reads.
+    :param bool cache: Return the previous reading instead of reading the ADC again
+                       while it is younger than ``max_age``. Defaults to False.
+    :param float max_age: Maximum age of a cached reading in seconds. Defaults to one
+                          conversion period at the device's current data rate.
     """
 
-    def __init__(self, ads: ADS1x15, positive_pin: int, negative_pin: Optional[int] = None):
+    __slots__ = (
+        "_ads",
+        "_cache",
+        "_calibration",
+        "_max_age",
+        "_negative_pin",
+        "_pin_setting",
+        "_table",
+        "is_differential",
+    )
+
+    def __init__(
+        self,
+        ads: ADS1x15,
+        positive_pin: int,
+        negative_pin: Optional[int] = None,
+        cache: bool = False,
+        max_age: Optional[float] = None,
+    ):
         self._ads = ads
+        # Reading, its time and the device config generation it was taken at,
+        # only allocated when caching is enabled
+        self._cache = [0, 0.0, -1] if cache else None
+        self._max_age = max_age
         self._pin_setting = positive_pin
         self._negative_pin = negative_pin
+        self._calibration = None
+        self._table = None
         self.is_differential = False
         if negative_pin is not None:
             pins = (self._pin_setting, self._negative_pin)
@@ -53,7 +160,40 @@ class AnalogIn:
         lower resolution, the value is 16-bit.
         """
         pin = self._pin_setting if self.is_differential else self._pin_setting + 0x04
-        return self._ads.read(pin)
+        cache = self._cache
+        if cache is None:
+            return self._ads.read(pin)
+
+        ads = self._ads
+        if cache[2] == ads._config_generation and time.monotonic() - cache[1] < self.max_age:
+            return cache[0]
+        value = ads.read(pin)
+        cache[0] = value
+        cache[1] = time.monotonic()
+        # Taken after the read, which itself may have written the config
+        cache[2] = ads._config_generation
+        return value
+
+    @property
+    def max_age(self) -> float:
+        """Maximum age in seconds of a cached reading when caching is enabled.
+        Unless set explicitly, this is one conversion period at the current
+        data rate, using the measured rate when available."""
+        if self._max_age is not None:
+            return self._max_age
+        rate = self._ads.measured_data_rate
+        return 1 / (self._ads.data_rate if rate is None else rate)
+
+    @max_age.setter
+    def max_age(self, max_age: Optional[float]) -> None:
+        self._max_age = max_age
+
+    def invalidate(self) -> None:
+        """Discard the cached reading so the next read goes to the ADC.
+        Cached readings are also discarded automatically whenever the device
+        configuration (gain, data rate or mode) changes."""
+        if self._cache is not None:
+            self._cache[2] = -1
 
     @property
     def voltage(self) -> float:
@@ -61,23 +201,79 @@ class AnalogIn:
         volts = self.convert_to_voltage(self.value)
         return volts
 
+    @property
+    def calibration(self) -> Optional[Tuple[int, float]]:
+        """Linear calibration applied to voltage conversions, as a tuple of
+        ``(offset, scale)``. ``offset`` is in native ADC codes (12-bit for the
+        ADS1015) and is subtracted before scaling, ``scale`` multiplies the
+        resulting voltage. Set to None to disable calibration."""
+        return self._calibration
+
+    @calibration.setter
+    def calibration(self, calibration: Optional[Tuple[int, float]]) -> None:
+        if calibration is not None:
+            offset, scale = calibration
+            calibration = (int(offset), float(scale))
+        self._calibration = calibration
+
     def convert_to_value(self, volts: float) -> int:
         """Calculates a standard 16-bit integer value for a given voltage"""
 
-        lsb = _ADS1X15_PGA_RANGE[self._ads.gain] / (1 << (self._ads.bits - 1))
-        value = int(volts / lsb)
+        lsb = _ADS1X15_PGA_RANGE[self._ads._gain_code] / (1 << (self._ads.bits - 1))
+        if self._calibration is None:
+            value = int(volts / lsb)
+        else:
+            offset, scale = self._calibration
+            value = int(volts / (lsb * scale)) + offset
 
         # Need to bit shift if value is only 12-bits
         value <<= 16 - self._ads.bits
         return value
 
+    def _voltage_table(self) -> Optional[array]:
+        """The voltage table for the current gain and calibration, if any."""
+        ads = self._ads
+        key = (ads.bits, ads._gain_code, self._calibration, _voltage_table_epoch[0])
+        entry = self._table
+        if entry is None or entry[0] != key:
+            self._table = None
+            entry = self._table = (key, _voltage_table(key[0], key[1], key[2]))
+        return entry[1]
+
     def convert_to_voltage(self, value_int: int) -> float:
         """Calculates voltage from 16-bit ADC reading"""
 
-        lsb = _ADS1X15_PGA_RANGE[self._ads.gain] / (1 << (self._ads.bits - 1))
+        bits = self._ads.bits
+        table = self._voltage_table()
+        if table is not None:
+            return table[(value_int >> (16 - bits)) & ((1 << bits) - 1)]
+
+        lsb = _ADS1X15_PGA_RANGE[self._ads._gain_code] / (1 << (bits - 1))
 
         # Need to bit shift if value is only 12-bits
-        value_int >>= 16 - self._ads.bits
-        volts = value_int * lsb
+        value_int >>= 16 - bits
+        if self._calibration is None:
+            return value_int * lsb
+        offset, scale = self._calibration
+        return (value_int - offset) * lsb * scale
 
-        return volts
+    def convert_to_voltages(self, values: Sequence[int], out: Optional[array] = None) -> array:
+        """Calculates voltages for a buffer of 16-bit ADC readings.
+
+        :param values: The readings, for example an ``array("h")`` of samples.
+        :param array out: Optional ``array("f")`` of at least the same length to
+                          store the voltages in. A new one is allocated if omitted.
+        """
+        count = len(values)
+        if out is None:
+            out = array("f", (0.0 for _ in range(count)))
+        table = self._voltage_table()
+        if table is None:
+            for i in range(count):
+                out[i] = self.convert_to_voltage(values[i])
+            return out
+        shift = 16 - self._ads.bits
+        mask = len(table) - 1
+        for i in range(count):
+            out[i] = table[(values[i] >> shift) & mask]
+        return out
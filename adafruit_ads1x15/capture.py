@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`capture`
+====================================================
+
+Oscilloscope style triggered capture of a stream of ADC readings.
+
+* Author(s): Adafruit Industries
+"""
+
+import time
+from array import array
+
+try:
+    from typing import Callable, Optional, Union
+
+    from .analog_in import AnalogIn
+except ImportError:
+    pass
+
+
+class Trigger_Mode:
+    """An enum-like class representing possible trigger conditions."""
+
+    RISING = 0
+    """Fires when a reading reaches the level from below"""
+    FALLING = 1
+    """Fires when a reading reaches the level from above"""
+    ABOVE = 2
+    """Fires on a reading at or above the level"""
+    BELOW = 3
+    """Fires on a reading at or below the level"""
+    OUTSIDE = 4
+    """Fires on a reading outside of the window between level and high"""
+    INSIDE = 5
+    """Fires on a reading inside of the window between level and high"""
+
+
+def _condition(mode: int, level: int, high: Optional[int]) -> Callable[[int, int], bool]:
+    """Build the trigger test, called with the previous and current reading."""
+    if mode == Trigger_Mode.RISING:
+        return lambda previous, value: previous < level <= value
+    if mode == Trigger_Mode.FALLING:
+        return lambda previous, value: previous > level >= value
+    if mode == Trigger_Mode.ABOVE:
+        return lambda previous, value: value >= level
+    if mode == Trigger_Mode.BELOW:
+        return lambda previous, value: value <= level
+    if high is None or high < level:
+        raise ValueError("Window triggers need a high level at or above level")
+    if mode == Trigger_Mode.OUTSIDE:
+        return lambda previous, value: not level <= value <= high
+    if mode == Trigger_Mode.INSIDE:
+        return lambda previous, value: level <= value <= high
+    raise ValueError("Unsupported trigger mode.")
+
+
+class TriggeredCapture:
+    """Captures a block of readings around a trigger event.
+
+    While waiting for the trigger, the most recent readings are kept in a
+    circular pre-trigger buffer. Trigger levels are compared against raw
+    readings, so use `AnalogIn.convert_to_value` to convert voltages once up
+    front. All buffers are allocated on construction, so memory use does not
+    grow however long the wait for the trigger is.
+
+    Each reading of the source is treated as one sample. Set the device to
+    `ads1x15.Mode.CONTINUOUS` for the fast read path, at a data rate the
+    capture loop keeps up with.
+
+    :param source: An `AnalogIn`, or a function returning a raw reading.
+    :param int pre_samples: The number of readings to keep from before the trigger.
+    :param int post_samples: The number of readings to capture from the trigger
+                             onwards, including the reading that fired it.
+    :param Trigger_Mode mode: The trigger condition. Defaults to `Trigger_Mode.RISING`.
+    :param int level: The trigger level, or the low edge of the window for window modes.
+    :param int high: The high edge of the window for window modes.
+    """
+
+    def __init__(
+        self,
+        source: Union[AnalogIn, Callable[[], int]],
+        pre_samples: int,
+        post_samples: int,
+        mode: int = Trigger_Mode.RISING,
+        level: int = 0,
+        high: Optional[int] = None,
+    ):
+        if post_samples < 1:
+            raise ValueError("At least the triggering reading must be captured")
+        self._read = source if callable(source) else lambda: source.value
+        self._condition = _condition(mode, level, high)
+        self._history = array("h", (0 for _ in range(pre_samples)))
+        self.block = array("h", (0 for _ in range(pre_samples + post_samples)))
+        """The last captured block. It is overwritten by the next capture."""
+        self.trigger_index = pre_samples
+        """Index in `block` of the reading that fired the trigger."""
+        self.pre_trigger_count = 0
+        """Number of pre-trigger readings actually captured, lower than requested
+        if the trigger fired before the buffer filled. They are right aligned
+        before `trigger_index`."""
+
+    def capture(self, timeout: Optional[float] = None) -> Optional[array]:
+        """Wait for the trigger and capture a block.
+
+        :param float timeout: Maximum time to wait for the trigger in seconds.
+                              Waits indefinitely if omitted.
+        :return: `block`, or None if the timeout passed without a trigger.
+        """
+        read = self._read
+        condition = self._condition
+        history = self._history
+        size = len(history)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        position = 0
+        filled = 0
+
+        previous = value = read()
+        while not condition(previous, value):
+            if size:
+                history[position] = value
+                position += 1
+                if position == size:
+                    position = 0
+                filled = min(filled + 1, size)
+            if deadline is not None and time.monotonic() > deadline:
+                return None
+            previous = value
+            value = read()
+
+        # Unroll the circular history in front of the trigger reading
+        block = self.block
+        start = size - filled
+        for i in range(filled):
+            block[start + i] = history[(position - filled + i) % size]
+        for i in range(start):
+            block[i] = 0
+        block[size] = value
+        for i in range(size + 1, len(block)):
+            block[i] = read()
+        self.pre_trigger_count = filled
+        return block
@@ -0,0 +1,232 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`characterize`
+====================================================
+
+Measures what throughput a device and its bus actually achieve, and how
+much noise each data rate and gain adds.
+
+* Author(s): Adafruit Industries
+"""
+
+import math
+import time
+
+from .ads1x15 import _ADS1X15_POINTER_HI_THRES, Mode
+from .stats import RunningStats, _channel_scaling
+
+try:
+    from typing import Dict, List, Optional, Sequence
+
+    from .ads1x15 import ADS1x15
+    from .analog_in import AnalogIn
+except ImportError:
+    pass
+
+# Fraction of a conversion period a read may take when pacing at the
+# conversion rate, leaving headroom for scheduling jitter
+_POLL_UTILIZATION = 0.8
+
+
+def _latencies(ads: ADS1x15, reads: int) -> Dict[str, float]:
+    """Average time of each kind of register access in seconds."""
+    start = time.monotonic()
+    for _ in range(reads):
+        ads.get_last_result(True)
+    fast = (time.monotonic() - start) / reads
+
+    start = time.monotonic()
+    for _ in range(reads):
+        ads.get_last_result(False)
+    register_read = (time.monotonic() - start) / reads
+
+    threshold = ads.comparator_high_threshold
+    start = time.monotonic()
+    for _ in range(reads):
+        ads._write_register(_ADS1X15_POINTER_HI_THRES, threshold)
+    register_write = (time.monotonic() - start) / reads
+
+    return {"fast_read": fast, "register_read": register_read, "register_write": register_write}
+
+
+def _scan_rate(channels: Sequence[AnalogIn], scans: int) -> float:
+    """Scans of all channels per second in the current mode."""
+    start = time.monotonic()
+    for _ in range(scans):
+        for channel in channels:
+            channel.value
+    return scans / (time.monotonic() - start)
+
+
+def _recommend(
+    results: List[Dict[str, object]], single: bool, fast_read: float
+) -> Dict[str, object]:
+    """Pick the fastest configuration that neither repeats nor skips readings."""
+    if single:
+        # A lone channel streams in CONTINUOUS mode, paced at the conversion
+        # rate, which only works while each read fits within a period
+        usable = [
+            entry
+            for entry in results
+            if fast_read <= _POLL_UTILIZATION / (entry["measured_rate"] or entry["data_rate"])
+        ]
+        best = max(usable or results[:1], key=lambda entry: entry["data_rate"])
+        rate = best["measured_rate"] or best["data_rate"]
+        return {
+            "data_rate": best["data_rate"],
+            "mode": Mode.CONTINUOUS,
+            "channel_rate": min(rate, 1 / fast_read),
+        }
+    # Several channels are scanned in SINGLE mode for exact channel attribution.
+    # Prefer the lower data rate, which is less noisy, when throughput ties.
+    best = results[0]
+    for entry in results[1:]:
+        if entry["scan_rate"] > best["scan_rate"] * 1.01:
+            best = entry
+    return {"data_rate": best["data_rate"], "mode": Mode.SINGLE, "channel_rate": best["scan_rate"]}
+
+
+def characterize(
+    ads: ADS1x15,
+    channels: Sequence[AnalogIn],
+    rates: Optional[Sequence[int]] = None,
+    reads: int = 50,
+    scans: int = 4,
+    conversions: int = 8,
+) -> Dict[str, object]:
+    """Measure bus latency, the real conversion rate at each data rate and the
+    rate at which the given channels can be scanned, and recommend the fastest
+    configuration for them. The device configuration is restored afterwards.
+
+    Measuring the conversion rate needs an input that is not perfectly static,
+    see `ADS1x15.measure_data_rate`. Where it cannot be measured,
+    ``measured_rate`` is None and the nominal rate is used instead.
+
+    :param ADS1x15 ads: The device to characterize.
+    :param channels: The `AnalogIn` channels that will be read together.
+    :param rates: The data rates to try. Defaults to all of ``ads.rates``.
+    :param int reads: The number of reads to average bus latency over.
+    :param int scans: The number of scans of ``channels`` to time per data rate.
+    :param int conversions: The number of conversions to time per data rate.
+    :return: A dictionary with ``latency`` (seconds per ``fast_read``,
+             ``register_read`` and ``register_write``), ``max_polling_rate``
+             (fast reads per second), ``rates`` (a list with the ``data_rate``,
+             ``measured_rate`` and ``scan_rate`` in scans per second of each
+             data rate tried) and ``recommendation`` (the ``data_rate``, ``mode``
+             and expected ``channel_rate`` in readings per second per channel).
+    """
+    data_rate, mode = ads.data_rate, ads.mode
+    try:
+        latency = _latencies(ads, reads)
+        results = []
+        for rate in ads.rates if rates is None else rates:
+            ads.data_rate = rate
+            try:
+                measured = ads.measure_data_rate(conversions)
+            except RuntimeError:
+                measured = None
+            ads.mode = Mode.SINGLE
+            results.append(
+                {
+                    "data_rate": rate,
+                    "measured_rate": measured,
+                    "scan_rate": _scan_rate(channels, scans),
+                }
+            )
+    finally:
+        ads.data_rate = data_rate
+        ads.mode = mode
+
+    results.sort(key=lambda entry: entry["data_rate"])
+    return {
+        "latency": latency,
+        "max_polling_rate": 1 / latency["fast_read"],
+        "rates": results,
+        "recommendation": _recommend(results, len(channels) == 1, latency["fast_read"]),
+    }
+
+
+def _resolution(spread: float, bits: int) -> float:
+    """Bits of resolution left when a spread of 16-bit codes is noise."""
+    if spread <= 0:
+        return float(bits)
+    return min(math.log2(65536 / spread), float(bits))
+
+
+def _noise(channel: AnalogIn, samples: int) -> Dict[str, float]:
+    """Noise of a block of readings at the device's current settings."""
+    stats = RunningStats()
+    for _ in range(samples):
+        stats.sample(channel)
+    scale = _channel_scaling(channel)[1]
+    bits = channel._ads.bits
+    spread = stats.maximum - stats.minimum
+    return {
+        "rms_noise": stats.stdev * scale,
+        "peak_to_peak": spread * scale,
+        "enob": _resolution(stats.stdev, bits),
+        "noise_free_bits": _resolution(spread, bits),
+    }
+
+
+def noise_profile(
+    channel: AnalogIn,
+    rates: Optional[Sequence[int]] = None,
+    gains: Optional[Sequence[float]] = None,
+    samples: int = 64,
+    target_bits: Optional[float] = None,
+) -> Dict[str, object]:
+    """Measure the noise of a channel at each combination of data rate and
+    gain, and find the fastest data rate that keeps a target resolution.
+    The device configuration is restored afterwards.
+
+    The channel should see a quiet, constant input, such as a shorted
+    differential pair or a stable reference, so that its readings only vary
+    by the noise of the ADC. Each reading is a separate SINGLE mode
+    conversion.
+
+    The effective number of bits is ``log2(full scale range / rms noise)``
+    and the noise free bits are ``log2(full scale range / peak to peak)``,
+    both limited to the resolution of the device.
+
+    :param AnalogIn channel: The channel to read.
+    :param rates: The data rates to try. Defaults to all of ``rates`` of the device.
+    :param gains: The gains to try. Defaults to all of ``gains`` of the device.
+    :param int samples: The number of readings per combination. Defaults to 64.
+    :param float target_bits: The effective number of bits required.
+    :return: A dictionary with ``results``, a list with the ``data_rate``,
+             ``gain``, ``rms_noise`` and ``peak_to_peak`` in volts, ``enob`` and
+             ``noise_free_bits`` of each combination, and ``fastest``, mapping
+             each gain to the highest data rate reaching ``target_bits``, or None
+             if none does or no target was given.
+    """
+    if samples < 2:
+        raise ValueError("Samples must be at least 2")
+    ads = channel._ads
+    data_rate, gain, mode = ads.data_rate, ads.gain, ads.mode
+    results = []
+    try:
+        ads.mode = Mode.SINGLE
+        for profile_gain in ads.gains if gains is None else gains:
+            ads.gain = profile_gain
+            for rate in ads.rates if rates is None else rates:
+                ads.data_rate = rate
+                entry = {"data_rate": rate, "gain": profile_gain}
+                entry.update(_noise(channel, samples))
+                results.append(entry)
+    finally:
+        ads.data_rate = data_rate
+        ads.gain = gain
+        ads.mode = mode
+
+    results.sort(key=lambda entry: (entry["gain"], entry["data_rate"]))
+    fastest = {}
+    for entry in results:
+        best = fastest.get(entry["gain"])
+        if target_bits is not None and entry["enob"] >= target_bits:
+            best = entry["data_rate"]
+        fastest[entry["gain"]] = best
+    return {"results": results, "fastest": fastest}
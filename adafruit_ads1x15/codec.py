@@ -0,0 +1,223 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`codec`
+====================================================
+
+Compact storage of blocks of readings for long-term logging.
+
+Readings are stored in frames. Each frame starts with a keyframe of
+absolute readings, followed by the difference of every reading from the
+previous reading of the same channel. Values are zigzag encoded, so that
+small negative differences stay small, and written as varints of seven
+bits per byte. Slowly changing signals mostly need one byte per reading.
+
+Frames are independent of each other and their headers hold their
+length, so decoding can start at any frame without reading the ones
+before it.
+
+Decoding is vectorized with NumPy when it is available.
+
+* Author(s): Adafruit Industries
+"""
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from micropython import const
+
+try:
+    from typing import Optional, Sequence, Tuple
+
+    from circuitpython_typing import WriteableBuffer
+except ImportError:
+    pass
+
+# First byte of every frame, to catch decoding of damaged or unrelated data
+_FRAME_MARKER = const(0xA5)
+# Longest varint of a zigzag encoded difference between 16-bit readings
+_MAX_VARINT_BYTES = const(3)
+
+
+class DeltaEncoder:
+    """Encodes blocks of readings incrementally and writes complete frames
+    to a sink, for example a file opened in binary mode.
+
+    Encoded readings are held in a fixed size buffer until their frame is
+    complete. A frame ends after ``keyframe_interval`` scans, or earlier
+    when the buffer could not hold another scan. Call `flush` to end the
+    current frame early, for example before closing the file.
+
+    :param sink: Object with a ``write`` method accepting bytes.
+    :param int channels: The number of channels interleaved in each block, as
+                         returned by `sampler.PeriodicSampler.sample`. Defaults to 1.
+    :param int keyframe_interval: The most scans per frame. Defaults to 256.
+    :param int buffer_size: The size of the frame buffer in bytes. Defaults to 1024.
+    """
+
+    def __init__(
+        self,
+        sink: object,
+        channels: int = 1,
+        keyframe_interval: int = 256,
+        buffer_size: int = 1024,
+    ):
+        if buffer_size < channels * _MAX_VARINT_BYTES:
+            raise ValueError("Buffer must hold at least one scan")
+        self.sink = sink
+        self.channels = channels
+        self.keyframe_interval = keyframe_interval
+        self._buffer = bytearray(buffer_size)
+        self._header = bytearray(16)
+        self._previous = array("l", (0 for _ in range(channels)))
+        self._used = 0
+        self._complete = 0
+        self._scans = 0
+        self._channel = 0
+
+    def write(self, values: Sequence[int]) -> None:
+        """Encode a block of 16-bit readings, with the channels of each scan
+        interleaved."""
+        buffer = self._buffer
+        previous = self._previous
+        channels = self.channels
+        limit = len(buffer) - channels * _MAX_VARINT_BYTES
+        for reading in values:
+            # Fixed width integers, such as NumPy int16, would overflow
+            value = int(reading)
+            channel = self._channel
+            if channel == 0 and (self._scans == self.keyframe_interval or self._used > limit):
+                self.flush()
+            delta = value - previous[channel] if self._scans else value
+            previous[channel] = value
+            self._used = _write_varint(buffer, self._used, _zigzag(delta))
+            channel += 1
+            if channel == channels:
+                channel = 0
+                self._scans += 1
+                self._complete = self._used
+            self._channel = channel
+
+    def flush(self) -> None:
+        """Write the current frame to the sink, if it has any complete scans.
+        Readings of an incomplete scan are kept for the next frame."""
+        if not self._scans:
+            return
+        end = self._complete
+        header = self._header
+        header[0] = _FRAME_MARKER
+        used = _write_varint(header, 1, self.channels)
+        used = _write_varint(header, used, self._scans)
+        used = _write_varint(header, used, end)
+        self.sink.write(memoryview(header)[:used])
+        self.sink.write(memoryview(self._buffer)[:end])
+        self._used = 0
+        self._complete = 0
+        self._scans = 0
+        # Start the next frame with the readings of an incomplete scan,
+        # now absolute as it is a keyframe
+        for channel in range(self._channel):
+            self._used = _write_varint(self._buffer, self._used, _zigzag(self._previous[channel]))
+
+
+def _zigzag(value: int) -> int:
+    """Map signed integers to unsigned ones, alternating by sign."""
+    return value << 1 if value >= 0 else -value * 2 - 1
+
+
+def _write_varint(buffer: WriteableBuffer, offset: int, value: int) -> int:
+    """Write an unsigned varint and return the offset after it."""
+    while value > 0x7F:
+        buffer[offset] = (value & 0x7F) | 0x80
+        value >>= 7
+        offset += 1
+    buffer[offset] = value
+    return offset + 1
+
+
+def _read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    """Read an unsigned varint and return it with the offset after it."""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
+
+
+def _read_header(data: bytes, offset: int) -> Tuple[int, int, int, int]:
+    """Read a frame header and return the channels, scans, body length and
+    the offset of the body."""
+    if data[offset] != _FRAME_MARKER:
+        raise ValueError("Data is not a frame of readings")
+    channels, offset = _read_varint(data, offset + 1)
+    scans, offset = _read_varint(data, offset)
+    length, offset = _read_varint(data, offset)
+    return channels, scans, length, offset
+
+
+def _decode_body(body: bytes, channels: int):
+    """Decode the varints of a frame body back into readings."""
+    if np is not None:
+        raw = np.frombuffer(body, dtype=np.uint8).astype(np.int64)
+        ends = np.flatnonzero(raw < 0x80)
+        starts = np.concatenate(([0], ends[:-1] + 1))
+        # Shift each byte by seven bits per byte before it within its varint
+        position = np.arange(len(raw)) - np.repeat(starts, ends - starts + 1)
+        zigzag = np.add.reduceat((raw & 0x7F) << (7 * position), starts)
+        deltas = (zigzag >> 1) ^ -(zigzag & 1)
+        return np.cumsum(deltas.reshape((-1, channels)), axis=0).astype(np.int16).reshape(-1)
+
+    values = array("h")
+    previous = [0] * channels
+    offset = 0
+    channel = 0
+    while offset < len(body):
+        zigzag, offset = _read_varint(body, offset)
+        previous[channel] += (zigzag >> 1) ^ -(zigzag & 1)
+        values.append(previous[channel])
+        channel = (channel + 1) % channels
+    return values
+
+
+def decode(data: bytes, start: int = 0, stop: Optional[int] = None) -> Tuple[object, int]:
+    """Decode the readings of scans ``start`` up to but excluding ``stop``
+    from data written by `DeltaEncoder`. Frames outside of the range are
+    skipped without being decoded.
+
+    :param data: The encoded bytes, as a bytes-like object.
+    :param int start: The first scan to decode. Defaults to 0.
+    :param int stop: The scan to stop before. Defaults to the end of the data.
+    :return: A tuple of the readings, with the channels of each scan interleaved,
+             and the number of channels. The readings are a NumPy ``int16``
+             array when NumPy is available and an ``array("h")`` otherwise.
+    """
+    blocks = []
+    channels = 1
+    scan = 0
+    offset = 0
+    while offset < len(data) and (stop is None or scan < stop):
+        channels, scans, length, body = _read_header(data, offset)
+        offset = body + length
+        if scan + scans > start:
+            values = _decode_body(memoryview(data)[body:offset], channels)
+            first = max(start - scan, 0) * channels
+            last = scans * channels if stop is None else min(stop - scan, scans) * channels
+            blocks.append(values[first:last])
+        scan += scans
+
+    if np is not None:
+        return (np.concatenate(blocks) if blocks else np.zeros(0, dtype=np.int16)), channels
+    values = array("h")
+    for block in blocks:
+        values.extend(block)
+    return values, channels
@@ -0,0 +1,178 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`multibus`
+====================================================
+
+Concurrent sampling of devices on separate I2C buses.
+
+Requires the ``threading`` module, so it is not available on CircuitPython.
+
+* Author(s): Adafruit Industries
+"""
+
+import heapq
+import time
+
+from .sampler import PeriodicSampler
+
+try:
+    from queue import Empty, Full, Queue
+    from threading import Event, Thread
+except ImportError:
+    Thread = None
+
+try:
+    from typing import List, Optional, Sequence, Tuple
+
+    from .analog_in import AnalogIn
+except ImportError:
+    pass
+
+# How often blocked workers check whether they should stop, in seconds
+_MULTIBUS_STOP_POLL = 0.1
+
+
+class MultiBusSampler:
+    """Samples channels on several I2C buses at the same time, with one
+    worker thread per bus, and merges their readings into one stream in
+    timestamp order.
+
+    Each worker scans its bus's channels with a `sampler.PeriodicSampler`
+    and hands blocks of scans to the merger through a bounded queue. When
+    the reader falls behind, full queues stop the workers until it catches
+    up. Readings are only released by `read` once every bus has reported a
+    later scan, so the merged stream never goes back in time.
+
+    Channels of devices on the same bus must be given to the same worker,
+    as each worker assumes it is the only user of its bus.
+
+    :param buses: One sequence of `AnalogIn` channels per bus.
+    :param float interval: Time between scans of each bus in seconds, see
+                           `sampler.PeriodicSampler`.
+    :param int block_size: The number of scans per block handed to the merger.
+                           Defaults to 32.
+    :param int queue_size: The most blocks waiting per bus. Defaults to 8.
+    """
+
+    def __init__(
+        self,
+        buses: Sequence[Sequence[AnalogIn]],
+        interval: Optional[float] = None,
+        block_size: int = 32,
+        queue_size: int = 8,
+    ):
+        if Thread is None:
+            raise RuntimeError("MultiBusSampler requires the threading module")
+        self.samplers = tuple(PeriodicSampler(channels, interval) for channels in buses)
+        self.block_size = block_size
+        self._queues = tuple(Queue(queue_size) for _ in self.samplers)
+        # Scans taken from a queue but not released yet are limited too
+        self._limit = queue_size * block_size
+        self._pending = [0] * len(self.samplers)
+        self._latest = [None] * len(self.samplers)
+        self._heap = []
+        self._threads = []
+        self._stop = Event()
+        self._arrived = Event()
+        self._error = None
+
+    def start(self) -> None:
+        """Start a worker thread per bus."""
+        if self._threads:
+            raise RuntimeError("Sampling has already started")
+        self._stop.clear()
+        for bus, sampler in enumerate(self.samplers):
+            thread = Thread(target=self._work, args=(bus, sampler), daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def stop(self) -> None:
+        """Stop the workers and wait for them to finish. Readings acquired
+        so far are still returned by `read`."""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def _work(self, bus: int, sampler: PeriodicSampler) -> None:
+        try:
+            # Blocks continue one schedule, so ticks stay evenly spaced
+            # across blocks however long handing a block over takes
+            resume = False
+            while not self._stop.is_set():
+                block = sampler.sample(self.block_size, resume=resume)
+                self._hand_over(self._queues[bus], block)
+                resume = True
+        except Exception as error:
+            self._error = error
+            self._stop.set()
+
+    def _hand_over(self, queue: Queue, block: Tuple[Sequence[int], Sequence[float]]) -> None:
+        """Queue a block, waiting while the queue is full unless stopped."""
+        while not self._stop.is_set():
+            try:
+                queue.put(block, timeout=_MULTIBUS_STOP_POLL)
+            except Full:
+                continue
+            self._arrived.set()
+            return
+
+    def _collect(self, bus: int, block: Tuple[Sequence[int], Sequence[float]]) -> None:
+        """Add the scans of a block to the merge heap."""
+        values, timestamps = block
+        width = len(self.samplers[bus].channels)
+        for index, timestamp in enumerate(timestamps):
+            scan = tuple(values[index * width : (index + 1) * width])
+            heapq.heappush(self._heap, (timestamp, bus, scan))
+        self._pending[bus] += len(timestamps)
+        if timestamps:
+            self._latest[bus] = timestamps[-1]
+
+    def read(self, timeout: Optional[float] = None) -> List[Tuple[float, int, Tuple[int, ...]]]:
+        """Return the scans of every bus that can be released so far, oldest
+        first, waiting up to ``timeout`` seconds for new blocks when there are
+        none yet. Without a timeout it does not wait.
+
+        :return: A list of ``(timestamp, bus, readings)`` tuples, with the
+                 `time.monotonic` timestamp of the scan, the index of its bus
+                 and a tuple with a reading per channel of that bus.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if self._error is not None:
+                error, self._error = self._error, None
+                raise error
+            self._arrived.clear()
+            released = self._release()
+            remaining = 0 if deadline is None else deadline - time.monotonic()
+            if released or remaining <= 0 or not self._threads:
+                return released
+            self._arrived.wait(remaining)
+
+    def _release(self) -> List[Tuple[float, int, Tuple[int, ...]]]:
+        """Take queued blocks and pop the scans older than every bus's latest."""
+        for bus, queue in enumerate(self._queues):
+            while self._pending[bus] < self._limit:
+                try:
+                    block = queue.get_nowait()
+                except Empty:
+                    break
+                self._collect(bus, block)
+
+        if self._threads:
+            if None in self._latest:
+                return []
+            watermark = min(self._latest)
+        else:
+            # Once stopped, no earlier scans can arrive
+            watermark = float("inf")
+        released = []
+        heap = self._heap
+        while heap and heap[0][0] <= watermark:
+            scan = heapq.heappop(heap)
+            self._pending[scan[1]] -= 1
+            released.append(scan)
+        return released
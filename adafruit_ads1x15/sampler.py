@@ -0,0 +1,184 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`sampler`
+====================================================
+
+Periodic sampling of AnalogIn channels with low timing jitter.
+
+* Author(s): Adafruit Industries
+"""
+
+import time
+from array import array
+
+try:
+    from typing import Dict, Optional, Sequence, Tuple, Union
+
+    from .analog_in import AnalogIn
+except ImportError:
+    pass
+
+_SAMPLER_INITIAL_SPIN = 0.001
+_SAMPLER_MINIMUM_SPIN = 0.00005
+
+
+def _percentile(ordered: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence."""
+    index = int(fraction * len(ordered) + 0.5) - 1
+    return ordered[min(max(index, 0), len(ordered) - 1)]
+
+
+def _process_time() -> Optional[float]:
+    """Processor time of the current process, or None where unavailable."""
+    try:
+        return time.process_time()
+    except AttributeError:
+        return None
+
+
+class PeriodicSampler:
+    """Reads one or more channels on a fixed schedule.
+
+    Each sample is scheduled on an absolute timebase, so timing errors do not
+    accumulate. The sampler sleeps until shortly before each deadline and then
+    busy-waits for the remainder, trading a little CPU time for accuracy
+    without occupying a whole core.
+
+    :param channels: An `AnalogIn` or a sequence of them, read in order at every tick.
+    :param float interval: Time between ticks in seconds. Defaults to one conversion
+                           period of the first channel's device.
+    :param float spin_time: How long before each deadline to stop sleeping and start
+                            busy-waiting, in seconds. By default this adapts to the
+                            observed oversleep of `time.sleep`.
+    """
+
+    def __init__(
+        self,
+        channels: Union[AnalogIn, Sequence[AnalogIn]],
+        interval: Optional[float] = None,
+        spin_time: Optional[float] = None,
+    ):
+        if not isinstance(channels, (list, tuple)):
+            channels = (channels,)
+        self.channels = tuple(channels)
+        if interval is None:
+            ads = self.channels[0]._ads
+            rate = ads.measured_data_rate
+            interval = 1 / (ads.data_rate if rate is None else rate)
+        self.interval = interval
+        self.spin_time = spin_time
+        self._spin = _SAMPLER_INITIAL_SPIN if spin_time is None else spin_time
+        self._lateness = array("f")
+        self._skips = 0
+        self._wall_time = 0.0
+        self._cpu_time = None
+        self._next = None
+
+    def sample(
+        self,
+        count: int,
+        values: Optional[array] = None,
+        timestamps: Optional[array] = None,
+        resume: bool = False,
+    ) -> Tuple[array, array]:
+        """Take ``count`` ticks of samples.
+
+        :param int count: The number of ticks to sample.
+        :param array values: Optional ``array("h")`` of at least ``count`` times the
+                             number of channels to store readings in, interleaved by
+                             channel. Allocated if omitted.
+        :param array timestamps: Optional ``array("d")`` of at least ``count`` entries
+                                 to store the `time.monotonic` time of each tick in.
+                                 Allocated if omitted.
+        :param bool resume: Continue the schedule of the previous call, so the first
+                            tick is one interval after its last one instead of
+                            immediately. Use this to sample in consecutive blocks
+                            without gaps or drift between them. Defaults to False.
+        :return: The ``(values, timestamps)`` arrays.
+        """
+        channels = self.channels
+        if values is None:
+            values = array("h", (0 for _ in range(count * len(channels))))
+        if timestamps is None:
+            timestamps = array("d", (0.0 for _ in range(count)))
+        lateness = self._lateness
+        if len(lateness) != count:
+            lateness = self._lateness = array("f", (0.0 for _ in range(count)))
+
+        interval = self.interval
+        skips = 0
+        tick = 0
+        index = 0
+
+        cpu_start = _process_time()
+        begin = time.monotonic()
+        start = self._next if resume and self._next is not None else begin
+        for i in range(count):
+            deadline = start + tick * interval
+            now = self.wait_until(deadline)
+            for channel in channels:
+                values[index] = channel.value
+                index += 1
+            timestamps[i] = now
+            lateness[i] = now - deadline
+            tick += 1
+            # Realign to the schedule if a whole interval was missed
+            behind = int((time.monotonic() - start) / interval) - tick
+            if behind > 0:
+                skips += behind
+                tick += behind
+        self._next = start + tick * interval
+        self._wall_time = time.monotonic() - begin
+        cpu_end = _process_time()
+        self._cpu_time = None if cpu_start is None else cpu_end - cpu_start
+        self._skips = skips
+        return values, timestamps
+
+    def wait_until(self, deadline: float) -> float:
+        """Sleep until shortly before a deadline, then busy-wait for it, with
+        the same spin time adaptation as `sample`.
+
+        :param float deadline: The `time.monotonic` time to wait for.
+        :return: The `time.monotonic` time when the wait ended.
+        """
+        monotonic = time.monotonic
+        now = monotonic()
+        wake = deadline - self._spin
+        if wake > now:
+            time.sleep(wake - now)
+            now = monotonic()
+            if self.spin_time is None:
+                # Track twice the recent oversleep, so that sleeping rarely
+                # overshoots the deadline but little time is spent spinning
+                oversleep = max(now - wake, 0.0)
+                self._spin = max(
+                    0.9 * self._spin + 0.2 * oversleep, oversleep, _SAMPLER_MINIMUM_SPIN
+                )
+        while now < deadline:
+            now = monotonic()
+        return now
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        """Timing statistics of the last call to `sample`.
+
+        ``jitter_p50``, ``jitter_p90``, ``jitter_p99`` and ``jitter_max`` are how late
+        ticks started relative to their deadline, in seconds. ``skips`` counts the
+        ticks dropped because sampling fell behind by a whole interval. ``cpu_time``
+        is the processor time used, or None where the platform cannot report it.
+        """
+        ordered = sorted(self._lateness)
+        if not ordered:
+            ordered = [0.0]
+        return {
+            "samples": len(self._lateness),
+            "skips": self._skips,
+            "jitter_p50": _percentile(ordered, 0.5),
+            "jitter_p90": _percentile(ordered, 0.9),
+            "jitter_p99": _percentile(ordered, 0.99),
+            "jitter_max": ordered[-1],
+            "wall_time": self._wall_time,
+            "cpu_time": self._cpu_time,
+        }
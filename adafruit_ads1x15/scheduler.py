@@ -0,0 +1,256 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`scheduler`
+====================================================
+
+Scanning channels of one ADC that need different sample rates.
+
+* Author(s): Adafruit Industries
+"""
+
+import time
+
+from .ads1x15 import (
+    _ADS1X15_CONFIG_OS_SINGLE,
+    _ADS1X15_OSCILLATOR_MARGIN,
+    _ADS1X15_POINTER_CONFIG,
+    Mode,
+)
+from .sampler import PeriodicSampler
+
+try:
+    from typing import Callable, Dict, List, Optional
+
+    from .ads1x15 import ADS1x15
+    from .analog_in import AnalogIn
+except ImportError:
+    pass
+
+# Transfers per single-shot read: config write, status poll and result read
+_SINGLE_SHOT_TRANSFERS = 3
+# Transfers when returning to the streamed channel: config write and result read
+_RESUME_TRANSFERS = 2
+
+
+class ScanScheduler:
+    """Builds and runs a periodic schedule for channels of one `ADS1x15`
+    with different target rates.
+
+    The channel with the highest target rate is streamed in CONTINUOUS mode
+    and read at its target rate, or once per conversion if the device cannot
+    convert that fast.
+    The other channels are read in SINGLE mode in bursts that interrupt the
+    stream, each burst reading every channel that is due, so that the number
+    of MUX switches and settle delays per cycle is as low as possible. One
+    cycle of the schedule lasts one period of the slowest channel.
+
+    :param ADS1x15 ads: The device the channels belong to.
+    :param float transfer_time: Estimated time of one bus transfer in seconds, for
+                                example a latency reported by `characterize.characterize`.
+                                Defaults to 0.5ms.
+    """
+
+    def __init__(self, ads: ADS1x15, transfer_time: float = 0.0005):
+        self.ads = ads
+        self.transfer_time = transfer_time
+        self.channels = []
+        self._stream = 0
+        self._cycle = 0.0
+        self._counts = []
+        self._bursts = []
+        self._stream_rate = 0.0
+        self._stream_interval = 0.0
+
+    def add(
+        self,
+        channel: AnalogIn,
+        rate: float,
+        data_rate: Optional[int] = None,
+        gain: Optional[float] = None,
+    ) -> int:
+        """Add a channel to the schedule and rebuild it.
+
+        :param AnalogIn channel: The channel, which must belong to ``ads``.
+        :param float rate: The target rate in samples per second.
+        :param int data_rate: The data rate to read the channel at. Defaults to the
+                              device's data rate when the channel is added.
+        :param float gain: The gain to read the channel at. Defaults to the device's
+                           gain when the channel is added.
+        :return: The index of the channel, as passed to the `run` callback.
+        """
+        if channel._ads is not self.ads:
+            raise ValueError("Channel must belong to the scheduled device")
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        ads = self.ads
+        if data_rate is not None and data_rate not in ads.rates:
+            raise ValueError(f"Data rate must be one of: {ads.rates}")
+        if gain is not None and gain not in ads.gains:
+            raise ValueError(f"Gain must be one of: {ads.gains}")
+        self.channels.append(
+            {
+                "channel": channel,
+                "rate": rate,
+                "data_rate": ads.data_rate if data_rate is None else data_rate,
+                "gain": ads.gain if gain is None else gain,
+            }
+        )
+        self._build()
+        return len(self.channels) - 1
+
+    def _period(self, data_rate: int) -> float:
+        """Conversion period at a data rate, measured if available."""
+        period = self.ads.conversion_period(data_rate)
+        if period is None:
+            return _ADS1X15_OSCILLATOR_MARGIN / data_rate
+        return period
+
+    def _build(self) -> None:
+        channels = self.channels
+        # Stream the fastest channel, every other one is read in bursts
+        stream = max(range(len(channels)), key=lambda index: channels[index]["rate"])
+        # Reading faster than the device converts would repeat results
+        interval = max(1 / channels[stream]["rate"], self._period(channels[stream]["data_rate"]))
+        slow = [index for index in range(len(channels)) if index != stream]
+        self._stream = stream
+        self._stream_interval = interval
+        self._counts = [1] * len(channels)
+        self._bursts = []
+        if not slow:
+            self._cycle = 1 / channels[stream]["rate"]
+            self._stream_rate = 1 / interval
+            return
+
+        cycle = 1 / min(channels[index]["rate"] for index in slow)
+        for index in slow:
+            self._counts[index] = max(1, round(channels[index]["rate"] * cycle))
+        # Spread each channel's readings evenly over the bursts of a cycle
+        bursts = [[] for _ in range(max(self._counts[index] for index in slow))]
+        for index in slow:
+            count = self._counts[index]
+            for reading in range(count):
+                bursts[reading * len(bursts) // count].append(index)
+
+        busy = 0.0
+        for burst in bursts:
+            for index in burst:
+                busy += self._period(channels[index]["data_rate"])
+                busy += _SINGLE_SHOT_TRANSFERS * self.transfer_time
+            # Returning to the stream waits as long as the driver does after a
+            # MUX change in CONTINUOUS mode
+            busy += self.ads.settle_time(channels[stream]["data_rate"])
+            busy += _RESUME_TRANSFERS * self.transfer_time
+        self._cycle = cycle
+        self._bursts = bursts
+        self._stream_rate = max(cycle - busy, 0.0) / cycle / interval
+
+    def report(self) -> Dict[str, object]:
+        """Describe the schedule and the rates it achieves.
+
+        :return: A dictionary with the ``cycle`` length in seconds, the ``bursts``
+                 per cycle as lists of channel indexes, ``switches_per_second``
+                 (MUX changes) and ``channels``, a list of dictionaries with the
+                 ``target_rate``, estimated ``achievable_rate``, whether the
+                 target is ``feasible``, and the ``data_rate`` and ``gain`` of
+                 each channel.
+        """
+        channels = self.channels
+        result = []
+        for index, entry in enumerate(channels):
+            if index == self._stream:
+                achievable = self._stream_rate
+            elif self._stream_rate > 0:
+                achievable = self._counts[index] / self._cycle
+            else:
+                achievable = 0.0
+            result.append(
+                {
+                    "target_rate": entry["rate"],
+                    "achievable_rate": achievable,
+                    "feasible": achievable >= entry["rate"] * 0.999,
+                    "data_rate": entry["data_rate"],
+                    "gain": entry["gain"],
+                }
+            )
+        switches = sum(len(burst) for burst in self._bursts) + len(self._bursts)
+        return {
+            "cycle": self._cycle,
+            "bursts": [list(burst) for burst in self._bursts],
+            "switches_per_second": switches / self._cycle if self._cycle else 0.0,
+            "channels": result,
+        }
+
+    def _write(self, config: int) -> None:
+        """Write a configuration register value and record it with the device."""
+        self.ads._write_register(_ADS1X15_POINTER_CONFIG, config)
+        self.ads._note_config(config)
+
+    def _single_shot(self, config: int) -> int:
+        """Start a conversion with a SINGLE mode configuration and read it."""
+        ads = self.ads
+        self._write(config)
+        while not ads._conversion_complete():
+            pass
+        return ads._conversion_value(ads.get_last_result(False))
+
+    def _stream_until(
+        self, config: int, end: float, pacer: PeriodicSampler, callback: Callable
+    ) -> None:
+        """Stream the fastest channel in CONTINUOUS mode until ``end``, paced
+        by ``pacer``."""
+        ads = self.ads
+        self._write(config)
+        time.sleep(ads.settle_time(self.channels[self._stream]["data_rate"]))
+        # The config write moved the register pointer, so the first read sets it
+        fast = False
+        deadline = time.monotonic()
+        while deadline < end:
+            now = pacer.wait_until(deadline)
+            callback(self._stream, now, ads._conversion_value(ads.get_last_result(fast)))
+            fast = True
+            deadline += pacer.interval
+
+    def _configs(self) -> List[int]:
+        """Configuration register value of each channel, in CONTINUOUS mode
+        for the streamed channel and SINGLE mode for the others."""
+        configs = []
+        for index, entry in enumerate(self.channels):
+            channel = entry["channel"]
+            pin = channel._pin_setting if channel.is_differential else channel._pin_setting + 0x04
+            mode = Mode.CONTINUOUS if index == self._stream else Mode.SINGLE
+            configs.append(self.ads._config_value(pin, entry["gain"], entry["data_rate"], mode))
+        return configs
+
+    def run(self, cycles: int, callback: Callable[[int, float, int], None]) -> None:
+        """Run the schedule. The device configuration is restored afterwards.
+
+        :param int cycles: The number of cycles to run.
+        :param callback: Called with the channel index, the `time.monotonic`
+                         timestamp and the raw reading of every sample.
+        """
+        if not self.channels:
+            return
+        ads = self.ads
+        configs = self._configs()
+        stream = self.channels[self._stream]["channel"]
+        pacer = PeriodicSampler(stream, interval=self._stream_interval)
+        bursts = self._bursts or [[]]
+        spacing = self._cycle / len(bursts)
+        with ads._lock:
+            original = ads._read_register(_ADS1X15_POINTER_CONFIG)
+            try:
+                start = time.monotonic()
+                for cycle in range(cycles):
+                    for number, burst in enumerate(bursts):
+                        end = start + cycle * self._cycle + (number + 1) * spacing
+                        self._stream_until(configs[self._stream], end, pacer, callback)
+                        for index in burst:
+                            callback(index, time.monotonic(), self._single_shot(configs[index]))
+            finally:
+                # Put the device's own configuration back without starting a
+                # conversion, and make the next read wait for a fresh result
+                self._write(original & ~_ADS1X15_CONFIG_OS_SINGLE)
+                ads._last_pin_read = None
@@ -0,0 +1,184 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`spectrum`
+====================================================
+
+Streaming spectral analysis of blocks of ADC readings.
+
+Requires NumPy, or ulab on CircuitPython boards.
+
+* Author(s): Adafruit Industries
+"""
+
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    try:
+        from ulab import numpy as np
+    except ImportError:
+        np = None
+
+from .stats import _channel_scaling
+
+try:
+    from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+    from .analog_in import AnalogIn
+except ImportError:
+    pass
+
+
+class SpectrumAnalyzer:
+    """Computes spectral features of a stream of readings over overlapping
+    Hann windowed FFT frames. Feed it blocks of readings as they are
+    acquired; a result is produced for every completed frame.
+
+    Each result is a dictionary with:
+
+    * ``rms``: root mean square of the frame with its mean removed
+    * ``dominant_frequency``: frequency of the strongest component in Hz
+    * ``thd``: total harmonic distortion relative to the dominant component
+    * ``band_powers``: mean square power within each of the ``bands``
+
+    The mean of each frame is removed before analysis. Powers are in squared
+    reported units, see ``scale``.
+
+    :param float sample_rate: The rate of the readings in samples per second.
+    :param int window_size: The number of readings per FFT frame, a power of two.
+                            Defaults to 256.
+    :param float overlap: Fraction of each frame shared with the next one, from 0
+                          up to but excluding 1. Defaults to 0.5.
+    :param bands: Sequence of ``(low, high)`` frequency ranges in Hz to report the
+                  power of. The low edge is inclusive and the high edge exclusive.
+    :param int harmonics: The highest harmonic included in the THD. Defaults to 5.
+    :param float scale: Factor converting readings to the reported unit. Defaults to 1.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float,
+        window_size: int = 256,
+        overlap: float = 0.5,
+        bands: Sequence[Tuple[float, float]] = (),
+        harmonics: int = 5,
+        scale: float = 1.0,
+    ):
+        if np is None:
+            raise RuntimeError("SpectrumAnalyzer requires numpy or ulab")
+        if window_size < 4 or window_size & (window_size - 1):
+            raise ValueError("Window size must be a power of two of at least 4")
+        if not 0 <= overlap < 1:
+            raise ValueError("Overlap must be at least 0 and less than 1")
+        self.sample_rate = sample_rate
+        self.window_size = window_size
+        self.bands = tuple(bands)
+        self.harmonics = harmonics
+        self.scale = scale
+        self._hop = max(1, int(window_size * (1 - overlap)))
+        self._frame = np.zeros(window_size)
+        self._filled = 0
+        self._window = 0.5 - 0.5 * np.cos(np.arange(window_size) * (2 * math.pi / window_size))
+        # Normalizes squared FFT magnitudes to one-sided mean square power per bin
+        self._norm = 2 / (window_size * np.sum(self._window * self._window))
+
+    @classmethod
+    def for_channel(cls, channel: AnalogIn, **kwargs) -> "SpectrumAnalyzer":
+        """Create an analyzer for `AnalogIn.value` readings of a channel,
+        reporting powers in volts squared. The sample rate is the device's
+        measured data rate, measured now if it has not been yet. Other
+        keyword arguments are passed on to the constructor."""
+        ads = channel._ads
+        rate = ads.measured_data_rate
+        if rate is None:
+            rate = ads.measure_data_rate()
+        return cls(rate, scale=_channel_scaling(channel)[1], **kwargs)
+
+    def reset(self) -> None:
+        """Discard readings of the partially filled frame."""
+        self._filled = 0
+
+    def feed(self, block: Sequence[Union[int, float]]) -> List[Dict[str, object]]:
+        """Add a block of readings and return the results of every frame it
+        completes, oldest first."""
+        results = []
+        frame = self._frame
+        size = self.window_size
+        count = len(block)
+        used = 0
+        while used < count:
+            take = min(size - self._filled, count - used)
+            frame[self._filled : self._filled + take] = block[used : used + take]
+            self._filled += take
+            used += take
+            if self._filled == size:
+                results.append(self._analyze())
+                keep = size - self._hop
+                frame[:keep] = frame[self._hop :]
+                self._filled = keep
+        return results
+
+    def _analyze(self) -> Dict[str, object]:
+        half = self.window_size // 2
+        resolution = self.sample_rate / self.window_size
+        centered = self._frame - np.mean(self._frame)
+        power = self._power_spectrum(centered)
+
+        peak = int(np.argmax(power[1:])) + 1
+        dominant = float(peak)
+        if peak < half:
+            # Refine the peak position between bins with a parabolic fit
+            left, middle, right = power[peak - 1], power[peak], power[peak + 1]
+            curvature = left - 2 * middle + right
+            if curvature:
+                dominant += float(0.5 * (left - right) / curvature)
+
+        fundamental = self._bin_power(power, peak)
+        distortion = 0.0
+        for harmonic in range(2, self.harmonics + 1):
+            index = int(dominant * harmonic + 0.5)
+            if index >= half:
+                break
+            distortion += self._bin_power(power, index)
+
+        return {
+            "rms": math.sqrt(float(np.mean(centered * centered))) * abs(self.scale),
+            "dominant_frequency": dominant * resolution,
+            "thd": math.sqrt(distortion / fundamental) if fundamental else 0.0,
+            "band_powers": self._band_powers(power, resolution),
+        }
+
+    def _band_powers(self, power, resolution: float) -> List[float]:
+        """Total power of the bins within each band."""
+        band_powers = []
+        for low, high in self.bands:
+            start = max(0, math.ceil(low / resolution))
+            stop = min(len(power), math.ceil(high / resolution))
+            band_powers.append(float(np.sum(power[start:stop])) if stop > start else 0.0)
+        return band_powers
+
+    def _power_spectrum(self, centered):
+        """One-sided power spectrum of a frame in squared reported units per bin."""
+        spectrum = np.fft.fft(centered * self._window)
+        if isinstance(spectrum, tuple):
+            # ulab without complex support returns the real and imaginary parts
+            real, imag = spectrum
+        else:
+            real, imag = np.real(spectrum), np.imag(spectrum)
+        half = self.window_size // 2
+        power = (real[: half + 1] ** 2 + imag[: half + 1] ** 2) * (
+            self._norm * self.scale * self.scale
+        )
+        # DC and Nyquist bins have no mirror image in the discarded half
+        power[0] *= 0.5
+        power[half] *= 0.5
+        return power
+
+    @staticmethod
+    def _bin_power(power, index: int) -> float:
+        """Power of a component, summed over the bins the Hann window spreads it to."""
+        return float(np.sum(power[max(index - 1, 0) : index + 2]))
@@ -0,0 +1,251 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`stats`
+====================================================
+
+Constant memory statistics over streams of ADC readings.
+
+Readings are accumulated as raw counts and only converted to the reported
+unit, for example volts, when a statistic is read.
+
+* Author(s): Adafruit Industries
+"""
+
+import math
+from array import array
+
+from .analog_in import _ADS1X15_PGA_RANGE
+
+try:
+    from typing import Iterable, Optional, Tuple, Union
+
+    from .analog_in import AnalogIn
+except ImportError:
+    pass
+
+
+def _channel_scaling(channel: AnalogIn) -> Tuple[float, float]:
+    """Offset and scale converting 16-bit readings of a channel to volts at
+    its device's current gain, including any channel calibration."""
+    ads = channel._ads
+    scale = _ADS1X15_PGA_RANGE[ads._gain_code] / 32768
+    offset = 0.0
+    calibration = channel.calibration
+    if calibration is not None:
+        offset = calibration[0] << (16 - ads.bits)
+        scale *= calibration[1]
+    return offset, scale
+
+
+class RunningStats:
+    """Mean, variance, minimum, maximum and RMS of a stream of readings,
+    updated one reading at a time with Welford's algorithm.
+
+    Statistics are reported as ``(reading - offset) * scale``.
+
+    :param float scale: Factor converting readings to the reported unit. Defaults to 1.
+    :param float offset: Reading corresponding to zero in the reported unit.
+                         Defaults to 0.
+    """
+
+    def __init__(self, scale: float = 1.0, offset: float = 0.0):
+        self.scale = scale
+        self.offset = offset
+        self.reset()
+
+    @classmethod
+    def for_channel(cls, channel: AnalogIn) -> "RunningStats":
+        """Create statistics of `AnalogIn.value` readings reported in volts at
+        the channel's current gain and calibration."""
+        offset, scale = _channel_scaling(channel)
+        return cls(scale=scale, offset=offset)
+
+    def reset(self) -> None:
+        """Discard all accumulated readings."""
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._min = None
+        self._max = None
+
+    def update(self, value: Union[int, float]) -> None:
+        """Add a reading."""
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+        if self._min is None or value < self._min:
+            self._min = value
+        if self._max is None or value > self._max:
+            self._max = value
+
+    def update_block(self, values: Iterable[Union[int, float]]) -> None:
+        """Add every reading of a block, for example the values returned by
+        `sampler.PeriodicSampler.sample`."""
+        for value in values:
+            self.update(value)
+
+    def sample(self, channel: AnalogIn) -> int:
+        """Read a channel, add the reading and return it."""
+        value = channel.value
+        self.update(value)
+        return value
+
+    @property
+    def count(self) -> int:
+        """The number of readings."""
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        """The mean of the readings."""
+        return (self._mean - self.offset) * self.scale
+
+    @property
+    def variance(self) -> float:
+        """The sample variance of the readings."""
+        if self._count < 2:
+            return 0.0
+        return self._m2 / (self._count - 1) * self.scale * self.scale
+
+    @property
+    def stdev(self) -> float:
+        """The sample standard deviation of the readings."""
+        return math.sqrt(self.variance)
+
+    @property
+    def minimum(self) -> Optional[float]:
+        """The smallest reading, or None without readings."""
+        if self._min is None:
+            return None
+        return (self._min - self.offset) * self.scale
+
+    @property
+    def maximum(self) -> Optional[float]:
+        """The largest reading, or None without readings."""
+        if self._max is None:
+            return None
+        return (self._max - self.offset) * self.scale
+
+    @property
+    def rms(self) -> float:
+        """The root mean square of the readings."""
+        if self._count == 0:
+            return 0.0
+        mean = self._mean - self.offset
+        return math.sqrt(mean * mean + self._m2 / self._count) * abs(self.scale)
+
+
+class _SlidingStats(RunningStats):
+    """Running statistics over the most recent readings, kept in a ring buffer."""
+
+    def __init__(self, window: int, scale: float, offset: float):
+        self._window = array("f", (0.0 for _ in range(window)))
+        self._next = 0
+        super().__init__(scale, offset)
+
+    def reset(self) -> None:
+        super().reset()
+        self._next = 0
+
+    def update(self, value: Union[int, float]) -> None:
+        window = self._window
+        size = len(window)
+        if self._count == size:
+            # Remove the oldest reading by reversing its Welford update
+            old = window[self._next]
+            self._count -= 1
+            if self._count:
+                delta = old - self._mean
+                self._mean -= delta / self._count
+                self._m2 = max(self._m2 - delta * (old - self._mean), 0.0)
+            else:
+                self._mean = 0.0
+                self._m2 = 0.0
+        window[self._next] = value
+        # Accumulate the stored value, so it is removed exactly later on
+        value = window[self._next]
+        self._next = (self._next + 1) % size
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+
+    @property
+    def minimum(self) -> Optional[float]:
+        if self._count == 0:
+            return None
+        return (min(self._readings()) - self.offset) * self.scale
+
+    @property
+    def maximum(self) -> Optional[float]:
+        if self._count == 0:
+            return None
+        return (max(self._readings()) - self.offset) * self.scale
+
+    def _readings(self):
+        if self._count == len(self._window):
+            return self._window
+        return self._window[: self._count]
+
+
+class WindowedStats:
+    """Statistics over fixed size windows of a stream of readings.
+
+    With tumbling windows, `update` returns the statistics of each completed
+    window of ``window`` readings; they stay valid until the next window
+    completes. With sliding windows, `update` returns the statistics of the
+    latest ``window`` readings once that many have been added. Memory use
+    does not depend on how many readings are added.
+
+    :param int window: The number of readings in a window.
+    :param bool sliding: Use a sliding instead of a tumbling window. Defaults to False.
+    :param float scale: Factor converting readings to the reported unit. Defaults to 1.
+    :param float offset: Reading corresponding to zero in the reported unit.
+                         Defaults to 0.
+    """
+
+    def __init__(self, window: int, sliding: bool = False, scale: float = 1.0, offset: float = 0.0):
+        if window < 1:
+            raise ValueError("Window must contain at least one reading")
+        self.window = window
+        self.sliding = sliding
+        if sliding:
+            self._current = _SlidingStats(window, scale, offset)
+            self._completed = self._current
+        else:
+            self._current = RunningStats(scale, offset)
+            self._completed = RunningStats(scale, offset)
+
+    @classmethod
+    def for_channel(cls, channel: AnalogIn, window: int, sliding: bool = False) -> "WindowedStats":
+        """Create windowed statistics of `AnalogIn.value` readings reported in
+        volts at the channel's current gain and calibration."""
+        offset, scale = _channel_scaling(channel)
+        return cls(window, sliding=sliding, scale=scale, offset=offset)
+
+    def reset(self) -> None:
+        """Discard all accumulated readings."""
+        self._current.reset()
+        self._completed.reset()
+
+    def update(self, value: Union[int, float]) -> Optional[RunningStats]:
+        """Add a reading. Returns the statistics of the window it completes,
+        or None if no window is complete yet."""
+        current = self._current
+        current.update(value)
+        if current.count < self.window:
+            return None
+        if self.sliding:
+            return current
+        # Swap buffers instead of allocating a new accumulator per window
+        self._current, self._completed = self._completed, current
+        self._current.reset()
+        return current
+
+    def sample(self, channel: AnalogIn) -> Optional[RunningStats]:
+        """Read a channel and add the reading, returning as `update` does."""
+        return self.update(channel.value)
@@ -0,0 +1,292 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`transport`
+====================================================
+
+Bus transports used by `ADS1x15` to access device registers. A transport
+executes a `Transaction`, a queued sequence of register reads and writes,
+as a single combined transfer where the backend supports it.
+
+* Author(s): Adafruit Industries
+"""
+
+from micropython import const
+
+try:
+    from typing import Callable, List, Optional, Union
+
+    from adafruit_bus_device.i2c_device import I2CDevice
+except ImportError:
+    pass
+
+try:
+    import ctypes
+    import fcntl
+    import os
+except ImportError:
+    ctypes = None
+
+_OP_WRITE = const(0)
+_OP_READ = const(1)
+_OP_READ_LAST = const(2)
+
+
+class Transaction:
+    """A sequence of register operations to submit to a transport in one go.
+
+    Transactions can be built once and submitted repeatedly. Values of queued
+    writes can be changed with `set_value` between submissions.
+    """
+
+    __slots__ = ("ops", "results")
+
+    def __init__(self):
+        self.ops = []
+        self.results = []
+        """Register values read by the last submission, in queued order."""
+
+    def write_register(self, reg: int, value: int) -> int:
+        """Queue a 16 bit register write. Returns the index of the operation."""
+        self.ops.append([_OP_WRITE, reg, value])
+        return len(self.ops) - 1
+
+    def read_register(self, reg: int) -> int:
+        """Queue a 16 bit register read. Returns the index of the result."""
+        self.ops.append([_OP_READ, reg, 0])
+        self.results.append(0)
+        return len(self.results) - 1
+
+    def read_last(self) -> int:
+        """Queue a 16 bit read of the register the pointer currently selects,
+        without updating the pointer. Returns the index of the result."""
+        self.ops.append([_OP_READ_LAST, 0, 0])
+        self.results.append(0)
+        return len(self.results) - 1
+
+    def set_value(self, index: int, value: int) -> None:
+        """Change the value written by the queued write at ``index``."""
+        self.ops[index][2] = value
+
+
+class Transport:
+    """Base class for register transports. Subclasses implement `submit`
+    and may override the single register helpers with faster versions.
+
+    ``combined`` is True when `submit` performs the whole transaction as one
+    bus transfer, so callers know that batching extra operations is cheap.
+    """
+
+    __slots__ = ("_single",)
+
+    combined = False
+
+    def __init__(self):
+        self._single = None
+
+    def submit(self, transaction: Transaction) -> List[int]:
+        """Perform every operation of the transaction in order and return
+        its ``results``."""
+        raise NotImplementedError("Subclass must implement submit function!")
+
+    def _single_transaction(self) -> Transaction:
+        """Transaction reused for single register accesses."""
+        if self._single is None:
+            self._single = Transaction()
+        return self._single
+
+    def write_register(self, reg: int, value: int) -> None:
+        """Write 16 bit value to register."""
+        single = self._single_transaction()
+        single.ops = [[_OP_WRITE, reg, value]]
+        single.results = []
+        self.submit(single)
+
+    def read_register(self, reg: int, fast: bool = False) -> int:
+        """Read 16 bit register value. If fast is True, the pointer register
+        is not updated.
+        """
+        single = self._single_transaction()
+        single.ops = [[_OP_READ_LAST if fast else _OP_READ, reg, 0]]
+        single.results = [0]
+        return self.submit(single)[0]
+
+
+class I2CDeviceTransport(Transport):
+    """Transport over an `adafruit_bus_device.i2c_device.I2CDevice`. The
+    device is locked once for a whole transaction, and each operation is a
+    separate bus transfer.
+
+    :param ~adafruit_bus_device.i2c_device.I2CDevice i2c_device: The device to talk to.
+    """
+
+    __slots__ = ("buf", "i2c_device")
+
+    def __init__(self, i2c_device: I2CDevice):
+        super().__init__()
+        self.i2c_device = i2c_device
+        self.buf = bytearray(3)
+
+    def submit(self, transaction: Transaction) -> List[int]:
+        buf = self.buf
+        results = transaction.results
+        index = 0
+        with self.i2c_device as i2c:
+            for kind, reg, value in transaction.ops:
+                if kind == _OP_WRITE:
+                    buf[0] = reg
+                    buf[1] = (value >> 8) & 0xFF
+                    buf[2] = value & 0xFF
+                    i2c.write(buf)
+                    continue
+                if kind == _OP_READ:
+                    buf[2] = reg
+                    i2c.write_then_readinto(buf, buf, out_start=2, in_end=2)
+                else:
+                    i2c.readinto(buf, end=2)
+                results[index] = buf[0] << 8 | buf[1]
+                index += 1
+        return results
+
+    def write_register(self, reg: int, value: int) -> None:
+        buf = self.buf
+        buf[0] = reg
+        buf[1] = (value >> 8) & 0xFF
+        buf[2] = value & 0xFF
+        with self.i2c_device as i2c:
+            i2c.write(buf)
+
+    def read_register(self, reg: int, fast: bool = False) -> int:
+        buf = self.buf
+        with self.i2c_device as i2c:
+            if fast:
+                i2c.readinto(buf, end=2)
+            else:
+                buf[2] = reg
+                i2c.write_then_readinto(buf, buf, out_start=2, in_end=2)
+        return buf[0] << 8 | buf[1]
+
+
+if ctypes is not None:
+
+    class _I2CMsg(ctypes.Structure):
+        _fields_ = [
+            ("addr", ctypes.c_uint16),
+            ("flags", ctypes.c_uint16),
+            ("len", ctypes.c_uint16),
+            ("buf", ctypes.POINTER(ctypes.c_uint8)),
+        ]
+
+    class _I2CRdwrData(ctypes.Structure):
+        _fields_ = [
+            ("msgs", ctypes.POINTER(_I2CMsg)),
+            ("nmsgs", ctypes.c_uint32),
+        ]
+
+
+_I2C_RDWR = const(0x0707)
+_I2C_M_RD = const(0x0001)
+_I2C_RDWR_MAX_MSGS = const(42)
+
+
+class LinuxI2CTransport(Transport):
+    """Transport using the Linux ``i2c-dev`` ``I2C_RDWR`` ioctl, which sends a
+    whole transaction as one combined transfer joined by repeated starts.
+
+    :param bus: The I2C bus number, or the path of its ``/dev/i2c-*`` device.
+    :param int address: The I2C address of the device.
+    """
+
+    __slots__ = ("_fd", "address")
+
+    combined = True
+
+    def __init__(self, bus: Union[int, str], address: int):
+        if ctypes is None:
+            raise RuntimeError("LinuxI2CTransport requires ctypes and fcntl")
+        super().__init__()
+        path = bus if isinstance(bus, str) else f"/dev/i2c-{bus}"
+        self.address = address
+        self._fd = os.open(path, os.O_RDWR)
+
+    def deinit(self) -> None:
+        """Close the bus device."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def submit(self, transaction: Transaction) -> List[int]:
+        msgs = []
+        reads = []
+        for kind, reg, value in transaction.ops:
+            if kind == _OP_WRITE:
+                msgs.append((0, (ctypes.c_uint8 * 3)(reg, (value >> 8) & 0xFF, value & 0xFF)))
+                continue
+            if kind == _OP_READ:
+                msgs.append((0, (ctypes.c_uint8 * 1)(reg)))
+            data = (ctypes.c_uint8 * 2)()
+            msgs.append((_I2C_M_RD, data))
+            reads.append(data)
+        if len(msgs) > _I2C_RDWR_MAX_MSGS:
+            raise ValueError(f"Transaction must fit in {_I2C_RDWR_MAX_MSGS} messages")
+
+        native = (_I2CMsg * len(msgs))()
+        for i, (flags, data) in enumerate(msgs):
+            native[i].addr = self.address
+            native[i].flags = flags
+            native[i].len = len(data)
+            native[i].buf = ctypes.cast(data, ctypes.POINTER(ctypes.c_uint8))
+        fcntl.ioctl(self._fd, _I2C_RDWR, _I2CRdwrData(native, len(msgs)))
+
+        results = transaction.results
+        for i, data in enumerate(reads):
+            results[i] = data[0] << 8 | data[1]
+        return results
+
+
+class FakeTransport(Transport):
+    """In-process model of an ADS1x15's registers for testing code without
+    hardware. Conversions complete instantly: writing the config register
+    starts one, as does each conversion register read in CONTINUOUS mode.
+
+    :param conversion: Function taking the MUX setting and returning the signed
+                       16 bit conversion result. Defaults to always returning 0.
+    """
+
+    __slots__ = ("conversion", "pointer", "registers", "submissions")
+
+    combined = True
+
+    def __init__(self, conversion: Optional[Callable[[int], int]] = None):
+        super().__init__()
+        self.conversion = conversion or (lambda mux: 0)
+        self.registers = [0x0000, 0x8583, 0x8000, 0x7FFF]
+        self.pointer = 0
+        self.submissions = 0
+        """Number of transactions performed, each one bus transfer on real hardware."""
+
+    def _convert(self) -> None:
+        config = self.registers[1]
+        self.registers[0] = self.conversion((config >> 12) & 0x07) & 0xFFFF
+        self.registers[1] = config | 0x8000
+
+    def submit(self, transaction: Transaction) -> List[int]:
+        self.submissions += 1
+        registers = self.registers
+        results = transaction.results
+        index = 0
+        for kind, reg, value in transaction.ops:
+            if kind != _OP_READ_LAST:
+                self.pointer = reg
+            if kind == _OP_WRITE:
+                registers[reg] = value
+                if reg == 1:
+                    self._convert()
+                continue
+            if self.pointer == 0 and not registers[1] & 0x0100:
+                self._convert()
+            results[index] = registers[self.pointer]
+            index += 1
+        return results
@@ -0,0 +1,246 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`virtual`
+====================================================
+
+Virtual channels derived from AnalogIn readings, such as shunt currents,
+thermistor temperatures and ratiometric readings. Their transforms are
+compiled ahead of time into a single scale and offset or a lookup table,
+and are evaluated for a whole block of readings at once.
+
+Uses NumPy, or ulab on CircuitPython boards, when available.
+
+* Author(s): Adafruit Industries
+"""
+
+import math
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    try:
+        from ulab import numpy as np
+    except ImportError:
+        np = None
+
+from micropython import const
+
+from .stats import _channel_scaling
+
+try:
+    from typing import Callable, List, Sequence
+
+    from .analog_in import AnalogIn
+except ImportError:
+    pass
+
+# Lookup tables have one entry per 12-bit code, the full ADS1015 resolution.
+# Readings of the ADS1115 are interpolated between entries.
+_TABLE_SIZE = const(4096)
+_TABLE_SHIFT = const(4)
+
+
+class LinearChannel:
+    """A virtual channel that is a linear function of a channel's voltage,
+    ``volts * scale + offset``.
+
+    :param AnalogIn channel: The input channel.
+    :param float scale: Factor applied to the voltage. Defaults to 1.
+    :param float offset: Value added after scaling. Defaults to 0.
+    """
+
+    def __init__(self, channel: AnalogIn, scale: float = 1.0, offset: float = 0.0):
+        self.inputs = (channel,)
+        self.scale = scale
+        self.offset = offset
+        self._compiled = (0.0, 1.0)
+
+    def compile(self) -> None:
+        """Fold the channel's current gain and calibration into a single
+        scale and offset applied to raw readings."""
+        raw_offset, volts_per_count = _channel_scaling(self.inputs[0])
+        scale = volts_per_count * self.scale
+        self._compiled = (scale, self.offset - raw_offset * scale)
+
+    def evaluate(self, columns: Sequence) -> Sequence[float]:
+        """Compute the virtual channel from a column of raw readings per input."""
+        scale, offset = self._compiled
+        column = columns[0]
+        if np is not None:
+            return column * scale + offset
+        return array("f", (value * scale + offset for value in column))
+
+
+class ShuntCurrent(LinearChannel):
+    """Current through a shunt resistor, in amps, from the voltage across it.
+
+    :param AnalogIn channel: The channel measuring the shunt, usually differential.
+    :param float resistance: The shunt resistance in ohms.
+    """
+
+    def __init__(self, channel: AnalogIn, resistance: float):
+        super().__init__(channel, scale=1 / resistance)
+
+
+class LookupChannel:
+    """A virtual channel that is an arbitrary function of a channel's
+    voltage, compiled into a lookup table over every raw reading.
+
+    :param AnalogIn channel: The input channel.
+    :param function: Function taking a voltage and returning the virtual value.
+    """
+
+    def __init__(self, channel: AnalogIn, function: Callable[[float], float]):
+        self.inputs = (channel,)
+        self.function = function
+        self._table = None
+        self._codes = None
+
+    def compile(self) -> None:
+        """Tabulate the function at the channel's current gain and calibration."""
+        raw_offset, volts_per_count = _channel_scaling(self.inputs[0])
+        step = 1 << _TABLE_SHIFT
+        half = _TABLE_SIZE // 2
+        # Entries are in signed order, starting at the most negative reading
+        values = (
+            self.function(((code - half) * step - raw_offset) * volts_per_count)
+            for code in range(_TABLE_SIZE)
+        )
+        if np is not None:
+            self._table = np.array(list(values))
+            self._codes = (np.arange(_TABLE_SIZE) - half) * step
+        else:
+            self._table = array("f", values)
+
+    def evaluate(self, columns: Sequence) -> Sequence[float]:
+        """Compute the virtual channel from a column of raw readings per input."""
+        column = columns[0]
+        if np is not None:
+            return np.interp(column, self._codes, self._table)
+        table = self._table
+        half = _TABLE_SIZE // 2
+        last = _TABLE_SIZE - 1
+        step = 1 << _TABLE_SHIFT
+        values = array("f")
+        for value in column:
+            index = (value >> _TABLE_SHIFT) + half
+            below = table[index]
+            above = table[min(index + 1, last)]
+            values.append(below + (above - below) * (value & (step - 1)) / step)
+        return values
+
+
+class Thermistor(LookupChannel):
+    """Temperature in degrees Celsius of an NTC thermistor wired from the
+    input to ground, with a series resistor from the input to ``supply``,
+    using the Steinhart-Hart equation. Readings outside of the divider's
+    range produce NaN.
+
+    :param AnalogIn channel: The channel measuring the divider.
+    :param float series_resistance: The series resistor in ohms.
+    :param float supply: The divider supply voltage.
+    :param float a: Steinhart-Hart coefficient A.
+    :param float b: Steinhart-Hart coefficient B.
+    :param float c: Steinhart-Hart coefficient C.
+    """
+
+    def __init__(
+        self,
+        channel: AnalogIn,
+        series_resistance: float,
+        supply: float,
+        a: float,
+        b: float,
+        c: float,
+    ):
+        def temperature(volts: float) -> float:
+            if not 0 < volts < supply:
+                return math.nan
+            log_r = math.log(series_resistance * volts / (supply - volts))
+            return 1 / (a + b * log_r + c * log_r * log_r * log_r) - 273.15
+
+        super().__init__(channel, temperature)
+
+
+class RatiometricChannel:
+    """Ratio of a channel's reading to a reference channel's reading,
+    multiplied by ``scale``. Both channels must share the same gain.
+    Readings with a reference of zero evaluate to nan.
+
+    :param AnalogIn channel: The measured channel.
+    :param AnalogIn reference: The reference channel, for example the excitation.
+    :param float scale: Factor applied to the ratio. Defaults to 1.
+    """
+
+    def __init__(self, channel: AnalogIn, reference: AnalogIn, scale: float = 1.0):
+        self.inputs = (channel, reference)
+        self.scale = scale
+
+    def compile(self) -> None:
+        """Nothing to precompute, the ratio does not depend on the gain."""
+
+    def evaluate(self, columns: Sequence) -> Sequence[float]:
+        """Compute the virtual channel from a column of raw readings per input."""
+        measured, reference = columns
+        scale = self.scale
+        if np is not None:
+            # Divide by one where the reference is zero to avoid a warning
+            valid = reference != 0
+            return np.where(valid, measured / np.where(valid, reference, 1) * scale, np.nan)
+        return array(
+            "f",
+            (value * scale / ref if ref else math.nan for value, ref in zip(measured, reference)),
+        )
+
+
+class VirtualChannels:
+    """Evaluates virtual channels on blocks of readings from a scan of
+    ``channels``, such as those returned by `sampler.PeriodicSampler.sample`.
+
+    Transforms are compiled on construction. Call `compile` again after
+    changing the gain or calibration of an input channel.
+
+    :param channels: The scanned `AnalogIn` channels, in the order readings of a
+                     scan are interleaved in blocks.
+    :param virtuals: The virtual channels to evaluate. Their inputs must be among
+                     ``channels``.
+    """
+
+    def __init__(self, channels: Sequence[AnalogIn], virtuals: Sequence):
+        self.channels = tuple(channels)
+        self.virtuals = tuple(virtuals)
+        self._columns = []
+        for virtual in self.virtuals:
+            try:
+                indexes = tuple(self.channels.index(channel) for channel in virtual.inputs)
+            except ValueError:
+                raise ValueError("Virtual channel inputs must be scanned channels") from None
+            self._columns.append(indexes)
+        self.compile()
+
+    def compile(self) -> None:
+        """Compile every virtual channel for the current channel settings."""
+        for virtual in self.virtuals:
+            virtual.compile()
+
+    def evaluate(self, values: Sequence[int]) -> List[Sequence[float]]:
+        """Compute every virtual channel for a block of interleaved readings.
+
+        :return: One sequence of values per virtual channel, in order.
+        """
+        width = len(self.channels)
+        if np is not None:
+            block = np.array(values).reshape((len(values) // width, width))
+            columns = [block[:, index] for index in range(width)]
+        else:
+            columns = [
+                [values[i] for i in range(index, len(values), width)] for index in range(width)
+            ]
+        return [
+            virtual.evaluate([columns[index] for index in indexes])
+            for virtual, indexes in zip(self.virtuals, self._columns)
+        ]
@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Reports the heap used by a rig of several ADCs and their channels, and
+# checks that reading them does not allocate. Run on a CircuitPython board.
+
+import gc
+
+import board
+
+from adafruit_ads1x15 import ADS1115, AnalogIn
+
+ADDRESSES = (0x48, 0x49, 0x4A, 0x4B)
+READS = 100
+
+# Create the I2C bus
+i2c = board.I2C()
+
+gc.collect()
+free_start = gc.mem_free()
+
+# Create every ADC and all of its single-ended channels
+adcs = [ADS1115(i2c, address=address) for address in ADDRESSES]
+channels = [AnalogIn(ads, pin) for ads in adcs for pin in range(4)]
+
+gc.collect()
+free_constructed = gc.mem_free()
+
+# Read every channel repeatedly without collecting in between
+gc.disable()
+free_before_reads = gc.mem_free()
+for _ in range(READS):
+    for chan in channels:
+        chan.value
+free_after_reads = gc.mem_free()
+gc.enable()
+
+per_read = (free_before_reads - free_after_reads) / (READS * len(channels))
+
+print(f"ADCs:                   {len(adcs):d}")
+print(f"Channels:               {len(channels):d}")
+print(f"Construction:           {free_start - free_constructed:d} bytes")
+print(f"Per channel read:       {per_read:.1f} bytes")
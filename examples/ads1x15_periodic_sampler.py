@@ -0,0 +1,31 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+import board
+
+from adafruit_ads1x15 import ADS1015, AnalogIn, ads1x15
+from adafruit_ads1x15.sampler import PeriodicSampler
+
+# Create the I2C bus
+i2c = board.I2C()
+
+# Create the ADC object using the I2C bus
+ads = ADS1015(i2c, data_rate=920, mode=ads1x15.Mode.CONTINUOUS)
+
+# Create single-ended input on channel 0
+chan = AnalogIn(ads, ads1x15.Pin.A0)
+
+# Sample at 500 Hz, sleeping until shortly before each deadline and then
+# busy-waiting. The busy-wait window adapts to how late sleeps wake up,
+# unless it is fixed with spin_time.
+sampler = PeriodicSampler(chan, interval=1 / 500)
+values, timestamps = sampler.sample(1000)
+
+stats = sampler.stats()
+print(f"Took {stats['wall_time']:5.3f} s to acquire {stats['samples']:d} samples.")
+print(f"Skipped      = {stats['skips']:d}")
+print(f"Jitter p50   = {stats['jitter_p50'] * 1e6:8.1f} us")
+print(f"Jitter p99   = {stats['jitter_p99'] * 1e6:8.1f} us")
+print(f"Jitter max   = {stats['jitter_max'] * 1e6:8.1f} us")
+if stats["cpu_time"] is not None:
+    print(f"CPU usage    = {stats['cpu_time'] / stats['wall_time']:9.2%}")